@@ -1,13 +1,15 @@
 from django import forms
 from django.contrib import admin, messages
+from django.contrib.admin.utils import unquote
+from django.contrib.admin.views.main import ChangeList
 from django.core.exceptions import ValidationError
 from .models import (
     Category, Product, ProductImage, ProductVariant, PricingTier, PricingTierData,
-    TableField, Item, ItemImage, ItemData, UserExclusivePrice, Cart, CartItem, Order, OrderItem, BillingAddress, ShippingAddress
+    TableField, Item, ItemImage, ItemData, UserExclusivePrice, Cart, CartItem, Order, OrderItem, BillingAddress, ShippingAddress,
+    preload_field_types, pricing_tier_bulk_mode,
 )
 from decimal import Decimal, ROUND_HALF_UP
 import logging
-from django.urls import reverse
 from django.http import HttpResponseRedirect
 from django.core.files.base import ContentFile
 from django.urls import reverse, path
@@ -15,7 +17,46 @@ from django.utils.html import format_html
 from backend_praco.utils import send_email
 from django.db import transaction
 
-class CategoryAdmin(admin.ModelAdmin):
+class CreatedAtFieldsetMixin:
+    """
+    Drops the created_at fieldset from add forms; the database fills the timestamp on insert.
+    """
+    def get_fieldsets(self, request, obj=None):
+        fieldsets = super().get_fieldsets(request, obj)
+        if obj is None:
+            fieldsets = [(name, options) for name, options in fieldsets if 'created_at' not in options['fields']]
+        return fieldsets
+
+class ValidatedSaveMixin:
+    """
+    Saves the object without re-running full_clean(): the ModelForm already validated it.
+    A ValidationError from save() is shown as messages and re-raised, unless
+    reraise_save_errors is False. Admins with extra pre-checks run them, then call super().
+    """
+    reraise_save_errors = True
+
+    def save_model(self, request, obj, form, change):
+        try:
+            obj.save(skip_validation=True)
+        except ValidationError as e:
+            for field, errors in e.error_dict.items():
+                for error in errors:
+                    messages.error(request, f"{field}: {error}" if field != '__all__' else error)
+            if self.reraise_save_errors:
+                raise
+
+class ListFieldsChangeList(ChangeList):
+    """
+    Changelist that only loads the model's LIST_FIELDS columns.
+    """
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        if request.method == 'POST' and self.list_editable:
+            # list_editable saves run full validation, load complete rows for them
+            return queryset
+        return self.model.for_listing(queryset)
+
+class CategoryAdmin(ValidatedSaveMixin, admin.ModelAdmin):
     list_display = ('name', 'slug', 'created_at')
     search_fields = ('name', 'slug')
     list_filter = ('created_at',)
@@ -39,14 +80,12 @@ class CategoryAdmin(admin.ModelAdmin):
         }),
     )
 
-    def save_model(self, request, obj, form, change):
-        try:
-            obj.save()
-        except ValidationError as e:
-            for field, errors in e.error_dict.items():
-                for error in errors:
-                    messages.error(request, f"{field}: {error}" if field != '__all__' else error)
-            raise
+    def get_queryset(self, request):
+        # The rich-text description is only rendered on the change form; keep it out of
+        # changelist and autocomplete queries over categories
+        qs = Category.objects_list.get_queryset()
+        ordering = self.get_ordering(request)
+        return qs.order_by(*ordering) if ordering else qs
 
     class Media:
         css = {
@@ -64,7 +103,7 @@ class ProductImageInline(admin.TabularInline):
             'all': ('admin/css/custom_admin.css',),
         }
 
-class ProductAdmin(admin.ModelAdmin):
+class ProductAdmin(ValidatedSaveMixin, admin.ModelAdmin):
     list_display = ('name', 'slug', 'category', 'is_new', 'created_at')
     search_fields = ('name', 'category__name')
     list_filter = ('category', 'is_new', 'created_at')
@@ -90,14 +129,15 @@ class ProductAdmin(admin.ModelAdmin):
         }),
     )
 
-    def save_model(self, request, obj, form, change):
-        try:
-            obj.save()
-        except ValidationError as e:
-            for field, errors in e.error_dict.items():
-                for error in errors:
-                    messages.error(request, f"{field}: {error}" if field != '__all__' else error)
-            raise
+    def get_queryset(self, request):
+        # The rich-text descriptions are only rendered on the change form; keep them out of
+        # changelist and autocomplete queries over products and their categories
+        qs = Product.objects_list.get_queryset()
+        ordering = self.get_ordering(request)
+        return qs.order_by(*ordering) if ordering else qs
+
+    def get_changelist(self, request, **kwargs):
+        return ListFieldsChangeList
 
     class Media:
         css = {
@@ -178,7 +218,7 @@ class PricingTierInline(admin.TabularInline):
             'all': ('admin/css/custom_admin.css',),
         }
 
-class PricingTierAdmin(admin.ModelAdmin):
+class PricingTierAdmin(CreatedAtFieldsetMixin, ValidatedSaveMixin, admin.ModelAdmin):
     list_display = ('product_variant', 'tier_type', 'range_start', 'range_end', 'no_end_range', 'created_at')
     search_fields = ('product_variant__name', 'tier_type')
     list_filter = ('tier_type', 'no_end_range', 'created_at')
@@ -203,64 +243,59 @@ class PricingTierAdmin(admin.ModelAdmin):
         }),
     )
 
+    reraise_save_errors = False
+
     def save_model(self, request, obj, form, change):
-        try:
-            # Validate tier constraints
-            existing_tiers = PricingTier.objects.filter(
-                product_variant=obj.product_variant,
-                tier_type=obj.tier_type
-            ).exclude(id=obj.id if change else None)
-
-            if obj.tier_type == 'pallet':
-                if existing_tiers.exists():
-                    messages.error(request, "Only one pallet pricing tier is allowed per product variant.")
-                    return
-            elif obj.tier_type == 'pack':
-                # Check if a tier with range_start=1 exists
-                has_first_tier = any(tier.range_start == 1 for tier in existing_tiers)
-                if not has_first_tier and obj.range_start != 1:
-                    messages.error(request, "The first pack pricing tier must start from 1.")
+        # Validate tier constraints
+        existing_tiers = PricingTier.objects.filter(
+            product_variant=obj.product_variant,
+            tier_type=obj.tier_type
+        ).exclude(id=obj.id if change else None)
+
+        if obj.tier_type == 'pallet':
+            if existing_tiers.exists():
+                messages.error(request, "Only one pallet pricing tier is allowed per product variant.")
+                return
+        elif obj.tier_type == 'pack':
+            # Check if a tier with range_start=1 exists
+            has_first_tier = any(tier.range_start == 1 for tier in existing_tiers)
+            if not has_first_tier and obj.range_start != 1:
+                messages.error(request, "The first pack pricing tier must start from 1.")
+                return
+            # Validate sequential ranges
+            all_tiers = list(existing_tiers) + [obj]
+            all_tiers.sort(key=lambda x: x.range_start)
+            for i in range(len(all_tiers) - 1):
+                current = all_tiers[i]
+                next_tier = all_tiers[i + 1]
+                current_end = float('inf') if current.no_end_range else (current.range_end if current.range_end is not None else float('inf'))
+                next_end = float('inf') if next_tier.no_end_range else (next_tier.range_end if next_tier.range_end is not None else float('inf'))
+                if current.range_start <= next_end and current_end >= next_tier.range_start:
+                    messages.error(request, (
+                        f"Range {current.range_start}-{'+' if current.no_end_range else current.range_end} overlaps with "
+                        f"range {next_tier.range_start}-{'+' if next_tier.no_end_range else next_tier.range_end} for {obj.tier_type}."
+                    ))
                     return
-                # Validate sequential ranges
-                all_tiers = list(existing_tiers) + [obj]
-                all_tiers.sort(key=lambda x: x.range_start)
-                for i in range(len(all_tiers) - 1):
-                    current = all_tiers[i]
-                    next_tier = all_tiers[i + 1]
-                    current_end = float('inf') if current.no_end_range else (current.range_end if current.range_end is not None else float('inf'))
-                    next_end = float('inf') if next_tier.no_end_range else (next_tier.range_end if next_tier.range_end is not None else float('inf'))
-                    if current.range_start <= next_end and current_end >= next_tier.range_start:
+                if not current.no_end_range:
+                    current_end = current.range_end if current.range_end is not None else float('inf')
+                    if next_tier.range_start != current_end + 1:
                         messages.error(request, (
-                            f"Range {current.range_start}-{'+' if current.no_end_range else current.range_end} overlaps with "
-                            f"range {next_tier.range_start}-{'+' if next_tier.no_end_range else next_tier.range_end} for {obj.tier_type}."
-                        ))
-                        return
-                    if not current.no_end_range:
-                        current_end = current.range_end if current.range_end is not None else float('inf')
-                        if next_tier.range_start != current_end + 1:
-                            messages.error(request, (
-                                f"Range {current.range_start}-{'+' if current.no_end_range else current.range_end} creates a gap or is not sequential "
-                                f"with range {next_tier.range_start}-{'+' if next_tier.no_end_range else next_tier.range_end} for {obj.tier_type}. "
-                                "Ensure ranges are sequential with no gaps."
-                            ))
-                            return
-                for i in range(len(all_tiers) - 1):
-                    current = all_tiers[i]
-                    if current.no_end_range:
-                        next_tier = all_tiers[i + 1]
-                        messages.error(request, (
-                            f"A tier with 'No End Range' checked must be the last tier. Cannot add {next_tier.range_start}-"
-                            f"{'+' if next_tier.no_end_range else next_tier.range_end} after {current.range_start}+ for {obj.tier_type}."
+                            f"Range {current.range_start}-{'+' if current.no_end_range else current.range_end} creates a gap or is not sequential "
+                            f"with range {next_tier.range_start}-{'+' if next_tier.no_end_range else next_tier.range_end} for {obj.tier_type}. "
+                            "Ensure ranges are sequential with no gaps."
                         ))
                         return
+            for i in range(len(all_tiers) - 1):
+                current = all_tiers[i]
+                if current.no_end_range:
+                    next_tier = all_tiers[i + 1]
+                    messages.error(request, (
+                        f"A tier with 'No End Range' checked must be the last tier. Cannot add {next_tier.range_start}-"
+                        f"{'+' if next_tier.no_end_range else next_tier.range_end} after {current.range_start}+ for {obj.tier_type}."
+                    ))
+                    return
 
-            obj.full_clean()
-            obj.save()
-        except ValidationError as e:
-            for field, errors in e.error_dict.items():
-                for error in errors:
-                    messages.error(request, f"{field}: {error}" if field != '__all__' else error)
-            return
+        super().save_model(request, obj, form, change)
 
     class Media:
         css = {
@@ -287,9 +322,8 @@ class TableFieldForm(forms.ModelForm):
 
     def clean_field_type(self):
         field_type = self.cleaned_data.get('field_type')
-        valid_types = [choice[0] for choice in TableField.FIELD_TYPES]
-        if field_type and field_type not in valid_types:
-            raise ValidationError(f"Field type must be one of: {', '.join(valid_types)}.")
+        if field_type and field_type not in TableField.FIELD_TYPE_VALUES:
+            raise ValidationError(f"Field type must be one of: {', '.join(choice[0] for choice in TableField.FIELD_TYPES)}.")
         return field_type
 
 
@@ -321,7 +355,7 @@ class TableFieldInline(admin.TabularInline):
             'all': ('admin/css/custom_admin.css',),
         }
 
-class ProductVariantAdmin(admin.ModelAdmin):
+class ProductVariantAdmin(CreatedAtFieldsetMixin, ValidatedSaveMixin, admin.ModelAdmin):
     list_display = ('name', 'product', 'status', 'show_units_per', 'created_at')
     search_fields = ('name', 'product__name')
     list_filter = ('status', 'show_units_per', 'created_at')
@@ -348,25 +382,20 @@ class ProductVariantAdmin(admin.ModelAdmin):
         }),
     )
 
+    reraise_save_errors = False
+
     def get_inlines(self, request, obj):
         if obj is None or not obj.pk:
             return []
         return [PricingTierInline]
 
     def save_model(self, request, obj, form, change):
-        try:
-            if not form.is_valid():
-                for field, errors in form.errors.items():
-                    for error in errors:
-                        messages.error(request, f"{field}: {error}")
-                return
-            obj.full_clean()
-            obj.save()
-        except ValidationError as e:
-            for field, errors in e.error_dict.items():
+        if not form.is_valid():
+            for field, errors in form.errors.items():
                 for error in errors:
-                    messages.error(request, f"{field}: {error}" if field != '__all__' else error)
+                    messages.error(request, f"{field}: {error}")
             return
+        super().save_model(request, obj, form, change)
 
     def save_related(self, request, form, formsets, change):
         try:
@@ -375,23 +404,18 @@ class ProductVariantAdmin(admin.ModelAdmin):
                     for error in errors:
                         messages.error(request, f"{field}: {error}")
                 return
-            super().save_related(request, form, formsets, change)
-            obj = form.instance
-            if obj.pk:
-                # Update status based on pricing tier conditions
-                pricing_tiers = obj.pricing_tiers.all()
-                if pricing_tiers.exists():
-                    # Use the first tier to check conditions, as all tiers share the same product_variant
-                    obj.status = 'active' if pricing_tiers[0].check_pricing_tiers_conditions() else 'draft'
-                else:
-                    obj.status = 'draft'
-                obj.save()
+            # Check the inline tiers against each other once, not per tier. On exit the status of
+            # a variant whose tiers were saved or deleted is recomputed and written only if it changed
+            with pricing_tier_bulk_mode():
+                super().save_related(request, form, formsets, change)
         except ValidationError as e:
-            for field, errors in e.error_dict.items():
+            # The batch tier checks raise a plain message list, filed under '__all__'
+            for field, errors in e.update_error_dict({}).items():
                 for error in errors:
                     messages.error(request, f"{field}: {error}" if field != '__all__' else error)
+            obj = form.instance
+            ProductVariant.raw_objects.filter(pk=obj.pk).exclude(status='draft').update(status='draft')
             obj.status = 'draft'
-            obj.save()
             return
 
     class Media:
@@ -413,7 +437,7 @@ class PricingTierDataInline(admin.TabularInline):
         }
 
 
-class PricingTierDataAdmin(admin.ModelAdmin):
+class PricingTierDataAdmin(CreatedAtFieldsetMixin, ValidatedSaveMixin, admin.ModelAdmin):
     list_display = ('item', 'pricing_tier', 'price', 'created_at')
     search_fields = ('item__sku', 'pricing_tier__product_variant__name')
     list_filter = ('created_at',)
@@ -433,22 +457,14 @@ class PricingTierDataAdmin(admin.ModelAdmin):
         }),
     )
 
-    def save_model(self, request, obj, form, change):
-        try:
-            obj.full_clean()
-            obj.save()
-        except ValidationError as e:
-            for field, errors in e.error_dict.items():
-                for error in errors:
-                    messages.error(request, f"{field}: {error}" if field != '__all__' else error)
-            return
+    reraise_save_errors = False
 
     class Media:
         css = {
             'all': ('admin/css/custom_admin.css',),
         }
 
-class TableFieldAdmin(admin.ModelAdmin):
+class TableFieldAdmin(CreatedAtFieldsetMixin, ValidatedSaveMixin, admin.ModelAdmin):
     list_display = ('name', 'product_variant', 'field_type', 'long_field', 'created_at')
     search_fields = ('name', 'product_variant__name')
     list_filter = ('field_type', 'long_field', 'created_at')
@@ -474,16 +490,6 @@ class TableFieldAdmin(admin.ModelAdmin):
         }),
     )
 
-    def save_model(self, request, obj, form, change):
-        try:
-            obj.save()
-        except ValidationError as e:
-            for field, errors in e.error_dict.items():
-                for error in errors:
-                    messages.error(request, f"{field}: {error}" if field != '__all__' else error)
-            raise
-
-
     class Media:
         css = {
             'all': ('admin/css/custom_admin.css',),
@@ -546,7 +552,7 @@ class ItemDataInline(admin.TabularInline):
             'all': ('admin/css/custom_admin.css',),
         }
 
-class ItemAdmin(admin.ModelAdmin):
+class ItemAdmin(ValidatedSaveMixin, admin.ModelAdmin):
     list_display = ('sku', 'product_variant', 'status', 'is_physical_product', 'track_inventory', 'stock', 'units_per_pack', 'created_at')
     search_fields = ('sku', 'product_variant__name')
     list_filter = ('status', 'is_physical_product', 'track_inventory', 'created_at')
@@ -583,27 +589,41 @@ class ItemAdmin(admin.ModelAdmin):
         }),
     )
 
+    reraise_save_errors = False
+
+    def get_changelist(self, request, **kwargs):
+        return ListFieldsChangeList
+
     def get_inlines(self, request, obj):
         if obj is None or not obj.pk:
             return []
         return [PricingTierDataInline, ItemImageInline, ItemDataInline]
 
+    def changeform_view(self, request, object_id=None, form_url='', extra_context=None):
+        if request.method == 'POST' and object_id:
+            # ItemDataInline validates every row; resolve their field types in one query.
+            # Only the variant id is read here, super() loads the item itself
+            try:
+                product_variant_id = Item.raw_objects.filter(pk=unquote(object_id)).values_list(
+                    'product_variant_id', flat=True
+                ).first()
+            except (ValueError, ValidationError):
+                product_variant_id = None
+            if product_variant_id is not None:
+                with preload_field_types(product_variant_id):
+                    return super().changeform_view(request, object_id, form_url, extra_context)
+        return super().changeform_view(request, object_id, form_url, extra_context)
+
     def save_model(self, request, obj, form, change):
-        try:
-            if not form.is_valid():
-                for field, errors in form.errors.items():
-                    for error in errors:
-                        messages.error(request, f"{field}: {error}")
-                return
-            if obj.product_variant.show_units_per == 'both' and not obj.is_physical_product:
-                messages.error(request, "Item must be a physical product when product variant show units per is set to 'both'.")
-                return
-            obj.save()
-        except ValidationError as e:
-            for field, errors in e.error_dict.items():
+        if not form.is_valid():
+            for field, errors in form.errors.items():
                 for error in errors:
-                    messages.error(request, f"{field}: {error}" if field != '__all__' else error)
+                    messages.error(request, f"{field}: {error}")
             return
+        if obj.product_variant.show_units_per == 'both' and not obj.is_physical_product:
+            messages.error(request, "Item must be a physical product when product variant show units per is set to 'both'.")
+            return
+        super().save_model(request, obj, form, change)
 
     def save_related(self, request, form, formsets, change):
         try:
@@ -611,12 +631,7 @@ class ItemAdmin(admin.ModelAdmin):
                 return
             super().save_related(request, form, formsets, change)
             obj = form.instance
-            pricing_tiers = obj.product_variant.pricing_tiers.all()
-            existing_pricing_data = set(obj.pricing_tier_data.values_list('pricing_tier_id', flat=True))
-            if all(tier.id in existing_pricing_data for tier in pricing_tiers):
-                obj.status = 'active'
-            else:
-                obj.status = 'draft'
+            obj.status = 'draft' if obj.missing_pricing_tiers().exists() else 'active'
             obj.save()
         except ValidationError as e:
             for field, errors in e.error_dict.items():
@@ -629,7 +644,7 @@ class ItemAdmin(admin.ModelAdmin):
             'all': ('admin/css/custom_admin.css',),
         }
 
-class ItemImageAdmin(admin.ModelAdmin):
+class ItemImageAdmin(ValidatedSaveMixin, admin.ModelAdmin):
     list_display = ('item', 'image', 'created_at')
     search_fields = ('item__sku',)
     list_filter = ('created_at',)
@@ -649,21 +664,12 @@ class ItemImageAdmin(admin.ModelAdmin):
         }),
     )
 
-    def save_model(self, request, obj, form, change):
-        try:
-            obj.save()
-        except ValidationError as e:
-            for field, errors in e.error_dict.items():
-                for error in errors:
-                    messages.error(request, f"{field}: {error}" if field != '__all__' else error)
-            raise
-
     class Media:
         css = {
             'all': ('admin/css/custom_admin.css',),
         }
 
-class ItemDataAdmin(admin.ModelAdmin):
+class ItemDataAdmin(CreatedAtFieldsetMixin, ValidatedSaveMixin, admin.ModelAdmin):
     list_display = ('item', 'field', 'value_text', 'value_number', 'value_image', 'created_at')
     search_fields = ('item__sku', 'field__name')
     list_filter = ('field__field_type', 'created_at')
@@ -688,16 +694,6 @@ class ItemDataAdmin(admin.ModelAdmin):
         }),
     )
 
-    def save_model(self, request, obj, form, change):
-        try:
-            obj.save()
-        except ValidationError as e:
-            for field, errors in e.error_dict.items():
-                for error in errors:
-                    messages.error(request, f"{field}: {error}" if field != '__all__' else error)
-            raise
-
-
     class Media:
         css = {
             'all': ('admin/css/custom_admin.css',),
@@ -737,56 +733,6 @@ class UserExclusivePriceAdmin(admin.ModelAdmin):
             'all': ('admin/css/custom_admin.css',),
         }
 
-class CartItemInline(admin.TabularInline):
-    model = CartItem
-    extra = 1
-    fields = ('item', 'pricing_tier', 'pack_quantity', 'user_exclusive_price', 'get_discount_percentage', 'get_price_per_unit', 'get_price_per_pack', 'get_subtotal', 'get_total', 'get_weight')
-    readonly_fields = ('created_at', 'get_discount_percentage', 'get_price_per_unit', 'get_price_per_pack', 'get_subtotal', 'get_total', 'get_weight')
-    autocomplete_fields = ['item', 'pricing_tier', 'user_exclusive_price']
-
-    def get_discount_percentage(self, obj):
-        return obj.user_exclusive_price.discount_percentage if obj.user_exclusive_price else Decimal('0.00')
-    get_discount_percentage.short_description = "Discount Percentage"
-
-    def get_price_per_unit(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        return pricing_data.price if pricing_data else Decimal('0.00')
-    get_price_per_unit.short_description = "Price Per Unit"
-
-    def get_price_per_pack(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
-            return pricing_data.price * Decimal(obj.item.units_per_pack or 1)
-        return Decimal('0.00')
-    get_price_per_pack.short_description = "Price Per Pack"
-
-    def get_subtotal(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
-            units_per_pack = obj.item.units_per_pack or 1
-            per_pack_price = pricing_data.price * Decimal(units_per_pack)
-            return (per_pack_price * Decimal(obj.pack_quantity)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        return Decimal('0.00')
-    get_subtotal.short_description = "Subtotal"
-
-    def get_total(self, obj):
-        subtotal = self.get_subtotal(obj)
-        discount_percentage = obj.user_exclusive_price.discount_percentage if obj.user_exclusive_price else Decimal('0.00')
-        discount = discount_percentage / Decimal('100.00')
-        return (subtotal * (Decimal('1.00') - discount)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-    get_total.short_description = "Total"
-
-    def get_weight(self, obj):
-        item_weight_kg = obj.convert_weight_to_kg(obj.item.weight, obj.item.weight_unit)
-        total_units = obj.total_units
-        return (item_weight_kg * Decimal(total_units)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-    get_weight.short_description = "Weight"
-
-    class Media:
-        css = {
-            'all': ('admin/css/custom_admin.css',),
-        }
-
 class CartItemInline(admin.TabularInline):
     model = CartItem
     extra = 0
@@ -796,37 +742,36 @@ class CartItemInline(admin.TabularInline):
     autocomplete_fields = ['item', 'pricing_tier', 'user_exclusive_price']
 
     def get_price_per_unit(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        return pricing_data.price if pricing_data else Decimal('0.00')
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        return price if price is not None else Decimal('0.00')
     get_price_per_unit.short_description = "Unit Price"
 
     def get_price_per_pack(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
-            return pricing_data.price * Decimal(obj.item.units_per_pack or 1)
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        if price is not None and obj.item:
+            return price * (obj.item.units_per_pack or 1)
         return Decimal('0.00')
     get_price_per_pack.short_description = "Pack Price"
 
     def get_subtotal(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        if price is not None and obj.item:
             units_per_pack = obj.item.units_per_pack or 1
-            per_pack_price = pricing_data.price * Decimal(units_per_pack)
-            return (per_pack_price * Decimal(obj.pack_quantity)).quantize(Decimal('0.01'))
+            per_pack_price = price * units_per_pack
+            return (per_pack_price * obj.pack_quantity).quantize(Decimal('0.01'))
         return Decimal('0.00')
     get_subtotal.short_description = "Subtotal"
 
     def get_total(self, obj):
         subtotal = self.get_subtotal(obj)
-        discount_percentage = obj.user_exclusive_price.discount_percentage if obj.user_exclusive_price else Decimal('0.00')
-        discount = discount_percentage / Decimal('100.00')
-        return (subtotal * (Decimal('1.00') - discount)).quantize(Decimal('0.01'))
+        price_multiplier = obj.user_exclusive_price.price_multiplier if obj.user_exclusive_price else Decimal('1.00')
+        return (subtotal * price_multiplier).quantize(Decimal('0.01'))
     get_total.short_description = "Total"
 
     def get_weight(self, obj):
         item_weight_kg = obj.convert_weight_to_kg(obj.item.weight, obj.item.weight_unit)
         total_units = obj.total_units
-        return (item_weight_kg * Decimal(total_units)).quantize(Decimal('0.01'))
+        return (item_weight_kg * total_units).quantize(Decimal('0.01'))
     get_weight.short_description = "Weight (kg)"
 
 class CartAdmin(admin.ModelAdmin):
@@ -926,37 +871,36 @@ class CartItemAdmin(admin.ModelAdmin):
     get_discount_percentage.short_description = "Discount %"
 
     def get_price_per_unit(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        return pricing_data.price if pricing_data else Decimal('0.00')
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        return price if price is not None else Decimal('0.00')
     get_price_per_unit.short_description = "Unit Price"
 
     def get_price_per_pack(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
-            return pricing_data.price * Decimal(obj.item.units_per_pack or 1)
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        if price is not None and obj.item:
+            return price * (obj.item.units_per_pack or 1)
         return Decimal('0.00')
     get_price_per_pack.short_description = "Pack Price"
 
     def get_subtotal(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        if price is not None and obj.item:
             units_per_pack = obj.item.units_per_pack or 1
-            per_pack_price = pricing_data.price * Decimal(units_per_pack)
-            return (per_pack_price * Decimal(obj.pack_quantity)).quantize(Decimal('0.01'))
+            per_pack_price = price * units_per_pack
+            return (per_pack_price * obj.pack_quantity).quantize(Decimal('0.01'))
         return Decimal('0.00')
     get_subtotal.short_description = "Subtotal"
 
     def get_total(self, obj):
         subtotal = self.get_subtotal(obj)
-        discount_percentage = obj.user_exclusive_price.discount_percentage if obj.user_exclusive_price else Decimal('0.00')
-        discount = discount_percentage / Decimal('100.00')
-        return (subtotal * (Decimal('1.00') - discount)).quantize(Decimal('0.01'))
+        price_multiplier = obj.user_exclusive_price.price_multiplier if obj.user_exclusive_price else Decimal('1.00')
+        return (subtotal * price_multiplier).quantize(Decimal('0.01'))
     get_total.short_description = "Total"
 
     def get_weight(self, obj):
         item_weight_kg = obj.convert_weight_to_kg(obj.item.weight, obj.item.weight_unit)
         total_units = obj.total_units
-        return (item_weight_kg * Decimal(total_units)).quantize(Decimal('0.01'))
+        return (item_weight_kg * total_units).quantize(Decimal('0.01'))
     get_weight.short_description = "Weight (kg)"
 
     def update_pricing_tiers(self, request, queryset):
@@ -1007,11 +951,11 @@ class CartItemAdmin(admin.ModelAdmin):
                     # Update other fields
                     existing_cart_item.user_exclusive_price = obj.user_exclusive_price
                     existing_cart_item.full_clean()
-                    existing_cart_item.save()
+                    existing_cart_item.save(skip_validation=True)
                     obj = existing_cart_item
                 else:
                     obj.full_clean()
-                    obj.save()
+                    obj.save(skip_validation=True)
 
                 # Update cart totals and pricing tiers
                 obj.cart.update_cart()
@@ -1065,8 +1009,8 @@ class OrderItemInline(admin.TabularInline):
 
     def get_price_per_unit(self, obj):
         try:
-            pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-            return pricing_data.price if pricing_data else Decimal('0.00')
+            price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+            return price if price is not None else Decimal('0.00')
         except Exception as e:
             # logger.error(f"Error getting price per unit for order item {obj.id}: {str(e)}")
             return Decimal('0.00')
@@ -1074,9 +1018,9 @@ class OrderItemInline(admin.TabularInline):
 
     def get_price_per_pack(self, obj):
         try:
-            pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-            if pricing_data and obj.item:
-                return pricing_data.price * Decimal(obj.item.units_per_pack or 1)
+            price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+            if price is not None and obj.item:
+                return price * (obj.item.units_per_pack or 1)
             return Decimal('0.00')
         except Exception as e:
             # logger.error(f"Error getting price per pack for order item {obj.id}: {str(e)}")
@@ -1085,11 +1029,11 @@ class OrderItemInline(admin.TabularInline):
 
     def get_subtotal(self, obj):
         try:
-            pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-            if pricing_data and obj.item:
+            price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+            if price is not None and obj.item:
                 units_per_pack = obj.item.units_per_pack or 1
-                per_pack_price = pricing_data.price * Decimal(units_per_pack)
-                return (per_pack_price * Decimal(obj.pack_quantity)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+                per_pack_price = price * units_per_pack
+                return (per_pack_price * obj.pack_quantity).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
             return Decimal('0.00')
         except Exception as e:
             # logger.error(f"Error getting subtotal for order item {obj.id}: {str(e)}")
@@ -1099,9 +1043,8 @@ class OrderItemInline(admin.TabularInline):
     def get_total(self, obj):
         try:
             subtotal = self.get_subtotal(obj)
-            discount_percentage = obj.user_exclusive_price.discount_percentage if obj.user_exclusive_price else Decimal('0.00')
-            discount = discount_percentage / Decimal('100.00')
-            return (subtotal * (Decimal('1.00') - discount)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            price_multiplier = obj.user_exclusive_price.price_multiplier if obj.user_exclusive_price else Decimal('1.00')
+            return (subtotal * price_multiplier).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
         except Exception as e:
             # logger.error(f"Error getting total for order item {obj.id}: {str(e)}")
             return Decimal('0.00')
@@ -1111,7 +1054,7 @@ class OrderItemInline(admin.TabularInline):
         try:
             item_weight_kg = obj.convert_weight_to_kg(obj.item.weight, obj.item.weight_unit)
             total_units = obj.total_units
-            return (item_weight_kg * Decimal(total_units)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            return (item_weight_kg * total_units).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
         except Exception as e:
             # logger.error(f"Error getting weight for order item {obj.id}: {str(e)}")
             return Decimal('0.00')
@@ -1149,7 +1092,7 @@ class OrderAdminForm(forms.ModelForm):
         normalized = status.upper() if status else status
         if normalized in status_map:
             normalized = status_map[normalized]
-        if normalized not in dict(Order.STATUS_CHOICES):
+        if normalized not in Order.STATUS_VALUES:
             raise ValidationError(f'"{status}" is not a valid choice.')
         return normalized
 
@@ -1164,7 +1107,7 @@ class OrderAdminForm(forms.ModelForm):
         normalized = payment_status.upper() if payment_status else payment_status
         if normalized in payment_status_map:
             normalized = payment_status_map[normalized]
-        if normalized not in dict(Order.PAYMENT_STATUS_CHOICES):
+        if normalized not in Order.PAYMENT_STATUS_VALUES:
             raise ValidationError(f'"{payment_status}" is not a valid choice.')
         return normalized
 
@@ -1601,8 +1544,8 @@ class OrderItemAdmin(admin.ModelAdmin):
 
     def get_price_per_unit(self, obj):
         try:
-            pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-            return pricing_data.price if pricing_data else Decimal('0.00')
+            price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+            return price if price is not None else Decimal('0.00')
         except Exception as e:
             # logger.error(f"Error getting price per unit for order item {obj.id}: {str(e)}")
             return Decimal('0.00')
@@ -1610,9 +1553,9 @@ class OrderItemAdmin(admin.ModelAdmin):
 
     def get_price_per_pack(self, obj):
         try:
-            pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-            if pricing_data and obj.item:
-                return pricing_data.price * Decimal(obj.item.units_per_pack or 1)
+            price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+            if price is not None and obj.item:
+                return price * (obj.item.units_per_pack or 1)
             return Decimal('0.00')
         except Exception as e:
             # logger.error(f"Error getting price per pack for order item {obj.id}: {str(e)}")
@@ -1621,11 +1564,11 @@ class OrderItemAdmin(admin.ModelAdmin):
 
     def get_subtotal(self, obj):
         try:
-            pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-            if pricing_data and obj.item:
+            price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+            if price is not None and obj.item:
                 units_per_pack = obj.item.units_per_pack or 1
-                per_pack_price = pricing_data.price * Decimal(units_per_pack)
-                return (per_pack_price * Decimal(obj.pack_quantity)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+                per_pack_price = price * units_per_pack
+                return (per_pack_price * obj.pack_quantity).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
             return Decimal('0.00')
         except Exception as e:
             # logger.error(f"Error getting subtotal for order item {obj.id}: {str(e)}")
@@ -1635,9 +1578,8 @@ class OrderItemAdmin(admin.ModelAdmin):
     def get_total(self, obj):
         try:
             subtotal = self.get_subtotal(obj)
-            discount_percentage = obj.user_exclusive_price.discount_percentage if obj.user_exclusive_price else Decimal('0.00')
-            discount = discount_percentage / Decimal('100.00')
-            return (subtotal * (Decimal('1.00') - discount)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            price_multiplier = obj.user_exclusive_price.price_multiplier if obj.user_exclusive_price else Decimal('1.00')
+            return (subtotal * price_multiplier).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
         except Exception as e:
             # logger.error(f"Error getting total for order item {obj.id}: {str(e)}")
             return Decimal('0.00')
@@ -1647,7 +1589,7 @@ class OrderItemAdmin(admin.ModelAdmin):
         try:
             item_weight_kg = obj.convert_weight_to_kg(obj.item.weight, obj.item.weight_unit)
             total_units = obj.total_units
-            return (item_weight_kg * Decimal(total_units)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            return (item_weight_kg * total_units).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
         except Exception as e:
             # logger.error(f"Error getting weight for order item {obj.id}: {str(e)}")
             return Decimal('0.00')
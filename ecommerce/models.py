@@ -1,4 +1,8 @@
 import logging
+import re
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from django.db import models
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -11,22 +15,143 @@ from django.dispatch import receiver
 from django.db import transaction
 from django.core.files.base import ContentFile
 import io
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import cm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.colors import HexColor
-from reportlab.platypus.flowables import Flowable
 import uuid
 from datetime import timedelta
 from io import BytesIO
 from phonenumber_field.modelfields import PhoneNumberField
 from backend_praco.utils import send_email
 import math
-from django.db.models import Sum 
+from django.db.models import Sum, Count, Q, Prefetch, F, Value, Exists, OuterRef, Case, When
+from django.db.models.functions import Coalesce, Mod, Now, NullIf
+from django.db.models.lookups import Exact
+
+# Constants shared by the clean()/save() paths so they are built once per process
+_ZERO = Decimal('0.00')
+_CENT = Decimal('0.01')
+_HUNDRED = Decimal('100.00')
+_KG_PER_WEIGHT_UNIT = {
+    'lb': Decimal('0.453592'),
+    'oz': Decimal('0.0283495'),
+    'g': Decimal('0.001'),
+    'kg': Decimal('1'),
+}
+_INCHES_PER_UNIT = {
+    'MM': Decimal('0.0393701'),
+    'CM': Decimal('0.393701'),
+    'M': Decimal('39.3701'),
+    'IN': Decimal('1'),
+}
+_MEASUREMENT_UNITS = frozenset(_INCHES_PER_UNIT)
+_DIMENSION_CATEGORIES = frozenset(['box', 'boxes', 'postal', 'postals', 'bag', 'bags'])
+_RANGE_END_MAX = 2**31 - 1  # upper bound of PositiveIntegerField, stands in for an open range
+
+class BulkImportMixin:
+    """
+    Adds a bulk_import() path for models whose save() only validates before writing.
+    Models whose created_at uses db_default=Now() take it from the database, so bulk_create
+    sends DEFAULT for it instead of a Python timestamp per row.
+    """
+    @classmethod
+    def bulk_import(cls, objs, batch_size=1000):
+        """
+        Validate objs in Python, check their unique field combinations against the
+        database with one query per batch, then insert them with bulk_create.
+        """
+        objs = list(objs)
+        errors = {}
+        foreign_keys = [field for field in cls._meta.concrete_fields if field.many_to_one]
+        for index, obj in enumerate(objs):
+            # A related object already loaded onto the row proves its foreign key exists
+            exclude = [field.name for field in foreign_keys if field.is_cached(obj)]
+            try:
+                obj.full_clean(exclude=exclude, validate_unique=False, validate_constraints=False)
+            except ValidationError as e:
+                errors[f"row {index}"] = e.messages
+        if errors:
+            raise ValidationError(errors)
 
-class Category(models.Model):
+        unique_groups = [
+            (field.name,) for field in cls._meta.local_fields if field.unique and not field.primary_key
+        ] + list(cls._meta.unique_together) + [
+            constraint.fields for constraint in cls._meta.total_unique_constraints
+        ]
+        for fields in unique_groups:
+            attnames = [cls._meta.get_field(name).attname for name in fields]
+            keys = [tuple(getattr(obj, attname) for attname in attnames) for obj in objs]
+            if len(set(keys)) != len(keys):
+                raise ValidationError(f"Duplicate {', '.join(fields)} combinations in the import batch.")
+            existing = set()
+            for start in range(0, len(keys), batch_size):
+                lookup = models.Q()
+                for key in keys[start:start + batch_size]:
+                    lookup |= models.Q(**dict(zip(attnames, key)))
+                existing.update(cls.objects.filter(lookup).values_list(*attnames))
+            if existing:
+                raise ValidationError(
+                    f"{len(existing)} {cls._meta.verbose_name_plural} with the same {', '.join(fields)} already exist."
+                )
+
+        return cls.objects.bulk_create(objs, batch_size=batch_size)
+
+def unique_slugs(queryset, base_slugs, reserved=()):
+    """
+    Return a free slug for each of base_slugs: the base slug itself, or base_slug-N one past the
+    highest suffix already used in queryset, reserved or earlier in the list. Reads every
+    colliding slug with a single prefix query on the slug index.
+    """
+    taken = set(reserved)
+    if base_slugs:
+        lookup = Q()
+        for base_slug in set(base_slugs):
+            lookup |= Q(slug=base_slug) | Q(slug__startswith=f"{base_slug}-")
+        taken.update(queryset.filter(lookup).values_list('slug', flat=True))
+    next_counters = {}
+    slugs = []
+    for base_slug in base_slugs:
+        slug = base_slug
+        while slug in taken:
+            if base_slug not in next_counters:
+                suffix = re.compile(rf"{re.escape(base_slug)}-(\d+)")
+                counters = [int(match.group(1)) for match in map(suffix.fullmatch, taken) if match]
+                next_counters[base_slug] = max(counters, default=0) + 1
+            slug = f"{base_slug}-{next_counters[base_slug]}"
+            next_counters[base_slug] += 1
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+def unique_slug(queryset, base_slug):
+    """
+    Return base_slug, or base_slug-N one past the highest suffix already used in queryset.
+    """
+    return unique_slugs(queryset, [base_slug])[0]
+
+class SlugBulkImportMixin(BulkImportMixin):
+    """
+    BulkImportMixin for models whose save() fills a blank slug from name: the blank slugs of a
+    batch are numbered together with one query instead of a lookup per row.
+    """
+    @classmethod
+    def bulk_import(cls, objs, batch_size=1000):
+        objs = list(objs)
+        unslugged = [obj for obj in objs if not obj.slug]
+        slugs = unique_slugs(
+            cls._base_manager.all(),
+            [slugify(obj.name) for obj in unslugged],
+            reserved={obj.slug for obj in objs if obj.slug},
+        )
+        for obj, slug in zip(unslugged, slugs):
+            obj.slug = slug
+        return super().bulk_import(objs, batch_size=batch_size)
+
+class CategoryListManager(models.Manager):
+    def get_queryset(self):
+        """
+        Leaves out the rich-text description for lists that never render it.
+        """
+        return super().get_queryset().defer('description')
+
+class Category(SlugBulkImportMixin, models.Model):
     """
     Represents a product category with a name, slug, description, and images.
     """
@@ -37,12 +162,10 @@ class Category(models.Model):
     slider_image = models.ImageField(upload_to='category_slider_images/', blank=True, null=True, help_text="Optional image for slider display")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = models.Manager()
+    objects_list = CategoryListManager()
+
     class Meta:
-        indexes = [
-            models.Index(fields=['name']),
-            models.Index(fields=['slug']),
-            models.Index(fields=['created_at']),
-        ]
         verbose_name = 'category'
         verbose_name_plural = 'categories'
 
@@ -50,24 +173,44 @@ class Category(models.Model):
         if not self.name:
             raise ValidationError({"name": "Category name is required."})
 
+    @property
+    def requires_dimensions(self):
+        """
+        Whether items in this category must have height, width, length and a measurement unit.
+        """
+        return self.name.lower() in _DIMENSION_CATEGORIES
+
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.name)
-            base_slug = self.slug
-            counter = 1
-            while Category.objects.filter(slug=self.slug).exclude(id=self.id).exists():
-                self.slug = f"{base_slug}-{counter}"
-                counter += 1
-        self.full_clean()
+            self.slug = unique_slug(Category.objects.exclude(id=self.id), slugify(self.name))
+        if not kwargs.pop('skip_validation', False):
+            self.full_clean()
         super().save(*args, **kwargs)
 
     def __str__(self):
         return self.name
 
-class Product(models.Model):
+class ProductManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the category used by __str__ and product listings.
+        """
+        return super().get_queryset().select_related('category')
+
+class ProductListManager(ProductManager):
+    def get_queryset(self):
+        """
+        Leaves out the rich-text descriptions of the product and its joined category.
+        """
+        return super().get_queryset().defer('description', 'category__description')
+
+class Product(SlugBulkImportMixin, models.Model):
     """
     Represents a product within a category, with a name, description, and images.
     """
+    # Columns rendered by list views; see for_listing()
+    LIST_FIELDS = ('id', 'category', 'name', 'slug', 'is_new', 'created_at')
+
     category = models.ForeignKey('Category', on_delete=models.CASCADE, related_name='products')
     name = models.CharField(max_length=255)
     slug = models.SlugField(max_length=255, blank=True, help_text="URL-friendly identifier, auto-generated if blank")
@@ -75,11 +218,11 @@ class Product(models.Model):
     is_new = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ProductManager()
+    objects_list = ProductListManager()
+    raw_objects = models.Manager()
+
     class Meta:
-        indexes = [
-            models.Index(fields=['category', 'name']),
-            models.Index(fields=['created_at']),
-        ]
         verbose_name = 'product'
         verbose_name_plural = 'products'
 
@@ -89,57 +232,90 @@ class Product(models.Model):
             errors['name'] = "Product name is required."
         elif not self.description:
             errors['description'] = "Product description is required."
-        elif not self.category:
+        elif not self.category_id:
             errors['category'] = "Please select a category for the product."
         if errors:
             raise ValidationError(errors)
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.name)
-            base_slug = self.slug
-            counter = 1
-            while Product.objects.filter(slug=self.slug).exclude(id=self.id).exists():
-                self.slug = f"{base_slug}-{counter}"
-                counter += 1
-        self.full_clean()
+            self.slug = unique_slug(Product.raw_objects.exclude(id=self.id), slugify(self.name))
+        if not kwargs.pop('skip_validation', False):
+            self.full_clean()
         super().save(*args, **kwargs)
+        _remember_saved_values(self, kwargs.get('update_fields'))
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    @classmethod
+    def for_listing(cls, queryset=None):
+        """
+        Restrict a queryset (all products by default) to LIST_FIELDS.
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        return queryset.only(*cls.LIST_FIELDS)
 
     def __str__(self):
         return f"{self.category.name} - {self.name}"
 
-class ProductImage(models.Model):
+class ProductImageManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the product used by __str__.
+        """
+        return super().get_queryset().select_related('product')
+
+class ProductImage(BulkImportMixin, models.Model):
     """
     Stores images associated with a product.
     """
-    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='images')
-    image = models.ImageField(upload_to='product_images/')
+    # Required-field messages are raised by clean_fields() from the id and file name, without
+    # loading the related row or opening the file (ForeignKey.validate still runs its existence query)
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name='images',
+        error_messages={'null': "Please select a product for this image."},
+    )
+    image = models.ImageField(
+        upload_to='product_images/',
+        error_messages={'blank': "Please upload an image for the product."},
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ProductImageManager()
+    raw_objects = models.Manager()
+
     class Meta:
-        indexes = [
-            models.Index(fields=['product']),
-        ]
         verbose_name = 'product image'
         verbose_name_plural = 'product images'
 
-    def clean(self):
-        errors = {}
-        if not self.image:
-            errors['image'] = "Please upload an image for the product."
-        elif not self.product:
-            errors['product'] = "Please select a product for this image."
-        if errors:
-            raise ValidationError(errors)
-
     def save(self, *args, **kwargs):
-        self.full_clean()
+        if not kwargs.pop('skip_validation', False):
+            self.full_clean()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_create_images(cls, product, files, batch_size=200):
+        """
+        Add uploaded files to product with one validation pass and batched INSERTs;
+        bulk_create stores each file when its row is written.
+        """
+        return cls.bulk_import([cls(product=product, image=file) for file in files], batch_size=batch_size)
+
     def __str__(self):
         return f"Image for {self.product.name}"
 
-class ProductVariant(models.Model):
+class ProductVariantManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the product (and its category) used by __str__.
+        """
+        return super().get_queryset().select_related('product__category')
+
+class ProductVariant(BulkImportMixin, models.Model):
     """
     Represents a variant of a product with specific attributes like pack units.
     """
@@ -157,13 +333,15 @@ class ProductVariant(models.Model):
     # units_per_pack = models.PositiveIntegerField(default=6, help_text="Number of units per pack")
     show_units_per = models.CharField(max_length=10, choices=SHOW_UNITS_PER_CHOICES, default='pack')
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='draft', editable=False)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Copy of product.category.requires_dimensions, kept in sync by save(), bulk_import() and the
+    # Category/Product post_save receivers
+    requires_dimensions = models.BooleanField(default=False, editable=False)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = ProductVariantManager()
+    raw_objects = models.Manager()
 
     class Meta:
-        indexes = [
-            models.Index(fields=['product', 'name']),
-            models.Index(fields=['created_at']),
-        ]
         verbose_name = 'product variant'
         verbose_name_plural = 'product variants'
 
@@ -179,13 +357,113 @@ class ProductVariant(models.Model):
         if errors:
             raise ValidationError(errors)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
     def save(self, *args, **kwargs):
-        self.full_clean()
+        if not kwargs.pop('skip_validation', False):
+            self.full_clean()
+        loaded = getattr(self, '_loaded_values', None)
+        if self.product_id and (loaded is None or loaded.get('product_id') != self.product_id):
+            self.requires_dimensions = self.product.category.requires_dimensions
         super().save(*args, **kwargs)
+        _remember_saved_values(self, kwargs.get('update_fields'))
+
+    @classmethod
+    def bulk_import(cls, objs, batch_size=1000):
+        objs = list(objs)
+        product_ids = {obj.product_id for obj in objs if obj.product_id}
+        category_names = dict(Product.raw_objects.filter(id__in=product_ids).values_list('id', 'category__name'))
+        for obj in objs:
+            obj.requires_dimensions = category_names.get(obj.product_id, '').lower() in _DIMENSION_CATEGORIES
+        return super().bulk_import(objs, batch_size=batch_size)
+
+    def validate_pricing_tiers(self):
+        """
+        Check whether this variant's pricing tiers satisfy the conditions for status='active'.
+        Reuses prefetched pricing_tiers when the caller loaded them with prefetch_related.
+        """
+        if not self.pk:
+            return False
+        prefetched = getattr(self, '_prefetched_objects_cache', {})
+        if 'pricing_tiers' in prefetched:
+            pricing_tiers = [
+                (tier.tier_type, tier.range_start, tier.range_end, tier.no_end_range)
+                for tier in prefetched['pricing_tiers']
+            ]
+        else:
+            # Plain tuples in index order, read from pt_variant_type_cover alone
+            pricing_tiers = PricingTier.raw_objects.filter(product_variant_id=self.pk).order_by(
+                'tier_type', 'range_start'
+            ).values_list('tier_type', 'range_start', 'range_end', 'no_end_range')
+
+        pack_ranges = []
+        pallet_count = 0
+        pack_no_end_count = 0
+        for tier_type, range_start, range_end, no_end_range in pricing_tiers:
+            if tier_type == 'pallet':
+                pallet_count += 1
+                continue
+            if tier_type != 'pack':
+                continue
+            if no_end_range:
+                pack_no_end_count += 1
+            elif range_end is None:
+                return False
+            pack_ranges.append((range_start, range_end, no_end_range))
+
+        if not pack_ranges or pack_no_end_count != 1:
+            return False
+        if self.show_units_per == 'pack' and pallet_count:
+            return False
+        if self.show_units_per == 'both' and pallet_count != 1:
+            return False
+
+        pack_ranges.sort(key=lambda pack_range: pack_range[0])
+        if pack_ranges[0][0] != 1:
+            return False
+        for (_, current_end, current_no_end), (next_start, _, _) in zip(pack_ranges, pack_ranges[1:]):
+            if current_no_end:
+                return False  # No tiers should exist after no_end_range
+            if next_start != current_end + 1:
+                return False
+        return True
+
+    @classmethod
+    def catalog_prefetches(cls, lookup=''):
+        """
+        Prefetches for rendering variants with ProductVariantSerializer. lookup is the path to the
+        variant (e.g. 'product_variant__') when variants are reached through another model. Tiers
+        and their pricing data, and product images, skip the joins of their default managers; the
+        prefetch already links them to their parents.
+        """
+        return [
+            Prefetch(f'{lookup}product__images', queryset=ProductImage.raw_objects.all()),
+            Prefetch(f'{lookup}pricing_tiers', queryset=PricingTier.raw_objects.all()),
+            Prefetch(f'{lookup}pricing_tiers__pricing_data', queryset=PricingTierData.raw_objects.all()),
+        ]
+
+    @classmethod
+    def with_catalog_prefetch(cls, queryset=None):
+        """
+        Apply catalog_prefetches() to a queryset (all variants by default).
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        return queryset.prefetch_related(*cls.catalog_prefetches())
 
     def __str__(self):
         return f"{self.product.name} - {self.name}"
 
+class PricingTierManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the product variant and product used by __str__.
+        """
+        return super().get_queryset().select_related('product_variant__product')
+
 class PricingTier(models.Model):
     """
     Defines pricing tiers for product variants based on quantity ranges for packs or weight-based for pallets.
@@ -194,18 +472,30 @@ class PricingTier(models.Model):
         ('pack', 'Pack'),
         ('pallet', 'Pallet'),
     )
+    TIER_TYPE_VALUES = frozenset(value for value, _ in TIER_TYPES)
+    # Columns read by the range and sequence checks
+    RANGE_FIELDS = ('product_variant', 'tier_type', 'range_start', 'range_end', 'no_end_range')
 
-    product_variant = models.ForeignKey('ProductVariant', on_delete=models.CASCADE, related_name='pricing_tiers')
+    # Indexed as the leading column of the composite index in Meta
+    product_variant = models.ForeignKey('ProductVariant', on_delete=models.CASCADE, related_name='pricing_tiers', db_index=False)
     tier_type = models.CharField(max_length=10, choices=TIER_TYPES)
     range_start = models.PositiveIntegerField(default=1, blank=True, help_text="Start of range for pack tiers; ignored for pallet tiers")
     range_end = models.PositiveIntegerField(null=True, blank=True, help_text="End of range for pack tiers; ignored for pallet tiers")
     no_end_range = models.BooleanField(default=False, help_text="Check if this pack tier has no end range; ignored for pallet tiers")
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = PricingTierManager()
+    raw_objects = models.Manager()
 
     class Meta:
         indexes = [
-            models.Index(fields=['product_variant', 'tier_type']),
-            models.Index(fields=['created_at']),
+            # Serves sibling lookups by variant/type; the range predicates in clean() and tier
+            # listings are answered from the included columns without heap fetches
+            models.Index(
+                fields=['product_variant', 'tier_type', 'range_start'],
+                include=['range_end', 'no_end_range'],
+                name='pt_variant_type_cover',
+            ),
         ]
         verbose_name = 'pricing tier'
         verbose_name_plural = 'pricing tiers'
@@ -219,16 +509,20 @@ class PricingTier(models.Model):
         if self.product_variant:
             if self.product_variant.show_units_per == 'pack' and self.tier_type != 'pack':
                 errors['tier_type'] = "Only 'Pack' tier type is allowed when the variant is set to show only pack."
-            elif self.product_variant.show_units_per == 'both' and self.tier_type not in ['pack', 'pallet']:
+            elif self.product_variant.show_units_per == 'both' and self.tier_type not in self.TIER_TYPE_VALUES:
                 errors['tier_type'] = "Tier type must be either 'Pack' or 'Pallet' when showing both."
 
         # Validate tiers
-        if self.product_variant:
-            # Fetch existing tiers except the current one (for updates)
-            existing_tiers = PricingTier.objects.filter(
+        if self.product_variant and _PRICING_TIER_BULK_VARIANTS.get() is not None:
+            # Sibling checks run once for the whole batch when pricing_tier_bulk_mode() exits
+            if self.tier_type == 'pack':
+                errors.update(self._check_pack_range())
+        elif self.product_variant:
+            # Existing tiers except the current one (for updates); only their ranges are read
+            existing_tiers = PricingTier.raw_objects.filter(
                 product_variant=self.product_variant,
                 tier_type=self.tier_type
-            ).exclude(id=self.id if self.id else None).order_by('range_start')
+            ).exclude(id=self.id if self.id else None)
 
             # Validate pallet tiers
             if self.tier_type == 'pallet':
@@ -236,73 +530,224 @@ class PricingTier(models.Model):
                     errors['tier_type'] = "Only one pallet tier is allowed per product variant."
             # Validate pack tiers
             elif self.tier_type == 'pack':
-                if self.range_start <= 0:
-                    errors['range_start'] = "Range start must be a positive number."
-                elif self.no_end_range and self.range_end is not None:
-                    errors['range_end'] = "Range end must be blank when 'No End Range' is checked."
-                elif not self.no_end_range and self.range_end is None:
-                    errors['range_end'] = "Range end is required for pack tiers unless 'No End Range' is checked."
-                elif not self.no_end_range and self.range_end <= self.range_start:
-                    errors['range_end'] = "Range end must be greater than range start for pack tiers."
-
-                all_tiers = list(existing_tiers)
-                all_tiers.append(self)
-                all_tiers.sort(key=lambda x: x.range_start)
-
-                # Check if any tier starts at 1
-                has_first_tier = any(tier.range_start == 1 for tier in existing_tiers)
-                
-                # If no existing tier starts at 1, this tier must start at 1
-                if not has_first_tier and self.range_start != 1:
-                    errors['range_start'] = "The first pack tier must start from 1."
-
-                # Check for overlaps, gaps, and ensure no_end_range is last
-                for i in range(len(all_tiers) - 1):
-                    current = all_tiers[i]
-                    next_tier = all_tiers[i + 1]
-                    current_end = float('inf') if current.no_end_range else (current.range_end if current.range_end is not None else float('inf'))
-                    next_end = float('inf') if next_tier.no_end_range else (next_tier.range_end if next_tier.range_end is not None else float('inf'))
-                    
-                    # Check for overlaps
-                    if current.range_start <= next_end and current_end >= next_tier.range_start:
-                        errors['range_start'] = (
-                            f"Range {current.range_start}-{'+' if current.no_end_range else current.range_end} overlaps with "
-                            f"range {next_tier.range_start}-{'+' if next_tier.no_end_range else next_tier.range_end} for {self.tier_type}."
-                        )
-                        break
-                    
-                    # Check for gaps and sequential order
-                    if not current.no_end_range:
-                        current_end = current.range_end if current.range_end is not None else float('inf')
-                        if next_tier.range_start != current_end + 1:
-                            errors['range_start'] = (
-                                f"Range {current.range_start}-{'+' if current.no_end_range else current.range_end} creates a gap or is not sequential "
-                                f"with range {next_tier.range_start}-{'+' if next_tier.no_end_range else next_tier.range_end} for {self.tier_type}. "
-                                "Ensure ranges are sequential with no gaps."
-                            )
-                            break
-                
-                # Ensure no_end_range is the last tier
-                for i in range(len(all_tiers) - 1):
-                    current = all_tiers[i]
-                    if current.no_end_range:
-                        next_tier = all_tiers[i + 1]
-                        errors['range_start'] = (
-                            f"A tier with 'No End Range' checked must be the last tier. Cannot add {next_tier.range_start}-"
-                            f"{'+' if next_tier.no_end_range else next_tier.range_end} after {current.range_start}+ for {self.tier_type}."
-                        )
-                        break
+                range_errors = self._check_pack_range()
+                if range_errors:
+                    errors.update(range_errors)
+                else:
+                    sequence_error = self._check_pack_sequence(existing_tiers)
+                    if sequence_error:
+                        errors['range_start'] = sequence_error
 
         if errors:
             raise ValidationError(errors)
 
+    def _check_pack_range(self):
+        if self.range_start <= 0:
+            return {'range_start': "Range start must be a positive number."}
+        if self.no_end_range and self.range_end is not None:
+            return {'range_end': "Range end must be blank when 'No End Range' is checked."}
+        if not self.no_end_range and self.range_end is None:
+            return {'range_end': "Range end is required for pack tiers unless 'No End Range' is checked."}
+        if not self.no_end_range and self.range_end <= self.range_start:
+            return {'range_end': "Range end must be greater than range start for pack tiers."}
+        return {}
+
+    @staticmethod
+    def _range_label(tier):
+        return f"{tier.range_start}-{'+' if tier.no_end_range else tier.range_end}"
+
+    def _overlap_message(self, other):
+        current, next_tier = sorted((other, self), key=lambda tier: tier.range_start)
+        if current.no_end_range:
+            return (
+                f"A tier with 'No End Range' checked must be the last tier. Cannot add {self._range_label(next_tier)} "
+                f"after {current.range_start}+ for {self.tier_type}."
+            )
+        return (
+            f"Range {self._range_label(current)} overlaps with "
+            f"range {self._range_label(next_tier)} for {self.tier_type}."
+        )
+
+    def _gap_message(self, current, next_tier):
+        return (
+            f"Range {self._range_label(current)} creates a gap or is not sequential "
+            f"with range {self._range_label(next_tier)} for {self.tier_type}. "
+            "Ensure ranges are sequential with no gaps."
+        )
+
+    def _check_pack_sequence(self, existing_tiers):
+        """
+        Check this pack tier against its siblings with a single aggregate query: it must not
+        overlap any of them, must join its neighbours without gaps and the tier list must
+        start from 1. Conflicting rows are only fetched to build the error message.
+        """
+        start = self.range_start
+        end = _RANGE_END_MAX if self.no_end_range else self.range_end
+        unbounded = Q(no_end_range=True) | Q(range_end__isnull=True)
+        overlapping = Q(range_start__lte=end) & (unbounded | Q(range_end__gte=start))
+
+        counts = existing_tiers.aggregate(
+            overlapping=Count('id', filter=overlapping),
+            first=Count('id', filter=Q(range_start=1)),
+            before=Count('id', filter=Q(range_start__lt=start)),
+            adjacent_before=Count('id', filter=Q(range_end=start - 1, no_end_range=False)),
+            after=Count('id', filter=Q(range_start__gt=start)),
+            adjacent_after=Count('id', filter=Q(range_start=end + 1)),
+        )
+
+        if counts['overlapping']:
+            return self._overlap_message(existing_tiers.filter(overlapping).order_by('range_start').first())
+
+        # If no existing tier starts at 1, this tier must start at 1
+        if not counts['first'] and start != 1:
+            return "The first pack tier must start from 1."
+
+        if counts['before'] and not counts['adjacent_before']:
+            return self._gap_message(existing_tiers.filter(range_start__lt=start).order_by('-range_start').first(), self)
+        if not self.no_end_range and counts['after'] and not counts['adjacent_after']:
+            return self._gap_message(self, existing_tiers.filter(range_start__gt=start).order_by('range_start').first())
+        return None
+
+    def _check_pack_sequence_in_memory(self, siblings):
+        """
+        Same checks and messages as _check_pack_sequence, against sibling tiers already in memory.
+        """
+        start = self.range_start
+        end = _RANGE_END_MAX if self.no_end_range else self.range_end
+        overlapping = [
+            tier for tier in siblings
+            if tier.range_start <= end and (tier.no_end_range or tier.range_end is None or tier.range_end >= start)
+        ]
+        if overlapping:
+            return self._overlap_message(min(overlapping, key=lambda tier: tier.range_start))
+
+        if start != 1 and not any(tier.range_start == 1 for tier in siblings):
+            return "The first pack tier must start from 1."
+
+        before = [tier for tier in siblings if tier.range_start < start]
+        if before and not any(tier.range_end == start - 1 and not tier.no_end_range for tier in before):
+            return self._gap_message(max(before, key=lambda tier: tier.range_start), self)
+        after = [tier for tier in siblings if tier.range_start > start]
+        if not self.no_end_range and after and not any(tier.range_start == end + 1 for tier in after):
+            return self._gap_message(self, min(after, key=lambda tier: tier.range_start))
+        return None
+
+    def _clean_in_batch(self, product_variant, siblings):
+        """
+        The checks of clean() for a tier whose variant and sibling tiers were preloaded by bulk_validate().
+        """
+        if product_variant is None:
+            return {'product_variant': "Please select a product variant for this pricing tier."}
+        errors = {}
+        if product_variant.show_units_per == 'pack' and self.tier_type != 'pack':
+            errors['tier_type'] = "Only 'Pack' tier type is allowed when the variant is set to show only pack."
+        elif product_variant.show_units_per == 'both' and self.tier_type not in self.TIER_TYPE_VALUES:
+            errors['tier_type'] = "Tier type must be either 'Pack' or 'Pallet' when showing both."
+
+        if self.tier_type == 'pallet':
+            if siblings:
+                errors['tier_type'] = "Only one pallet tier is allowed per product variant."
+        elif self.tier_type == 'pack':
+            range_errors = self._check_pack_range()
+            if range_errors:
+                errors.update(range_errors)
+            else:
+                sequence_error = self._check_pack_sequence_in_memory(siblings)
+                if sequence_error:
+                    errors['range_start'] = sequence_error
+        return errors
+
+    @classmethod
+    def bulk_validate(cls, tiers):
+        """
+        Validate new tiers as one batch: their variants and the variants' existing tiers are
+        loaded with one query each, then every tier is checked in memory against the existing
+        tiers and the rest of the batch. Raises a ValidationError keyed by row.
+        """
+        tiers = list(tiers)
+        errors = {}
+        for index, tier in enumerate(tiers):
+            try:
+                # The variant is checked against the preloaded rows below instead of once per row
+                tier.clean_fields(exclude=['product_variant'])
+            except ValidationError as e:
+                errors[f"row {index}"] = e.messages
+        if errors:
+            raise ValidationError(errors)
+
+        variant_ids = {tier.product_variant_id for tier in tiers if tier.product_variant_id}
+        variants = ProductVariant.raw_objects.only('show_units_per').in_bulk(variant_ids)
+        groups = defaultdict(list)
+        for tier in cls.raw_objects.filter(product_variant_id__in=variant_ids).only(*cls.RANGE_FIELDS):
+            groups[(tier.product_variant_id, tier.tier_type)].append(tier)
+        for tier in tiers:
+            groups[(tier.product_variant_id, tier.tier_type)].append(tier)
+
+        for index, tier in enumerate(tiers):
+            siblings = [other for other in groups[(tier.product_variant_id, tier.tier_type)] if other is not tier]
+            tier_errors = tier._clean_in_batch(variants.get(tier.product_variant_id), siblings)
+            if tier_errors:
+                errors[f"row {index}"] = list(tier_errors.values())
+        if errors:
+            raise ValidationError(errors)
+
+    @classmethod
+    def bulk_import(cls, tiers, batch_size=1000):
+        """
+        Validate new tiers with bulk_validate(), insert them with bulk_create and refresh the
+        status of the affected product variants once, instead of once per saved tier.
+        """
+        tiers = list(tiers)
+        cls.bulk_validate(tiers)
+        with transaction.atomic():
+            created = cls.objects.bulk_create(tiers, batch_size=batch_size)
+            cls._refresh_variant_statuses({tier.product_variant_id for tier in tiers})
+        return created
+
+    @classmethod
+    def _validate_variant_tiers(cls, variant_ids):
+        """
+        Run the sibling checks of clean() over all saved tiers of the given variants with one query.
+        """
+        groups = defaultdict(list)
+        for tier in cls.raw_objects.filter(product_variant_id__in=variant_ids).only(*cls.RANGE_FIELDS):
+            groups[(tier.product_variant_id, tier.tier_type)].append(tier)
+        messages = {}
+        for tiers in groups.values():
+            for tier in tiers:
+                siblings = [other for other in tiers if other is not tier]
+                if tier.tier_type == 'pallet':
+                    message = "Only one pallet tier is allowed per product variant." if siblings else None
+                else:
+                    message = tier._check_pack_sequence_in_memory(siblings)
+                if message:
+                    messages[message] = None
+        if messages:
+            raise ValidationError(list(messages))
+
+    @classmethod
+    def _refresh_variant_statuses(cls, variant_ids):
+        """
+        Recompute the status of the given variants from their tiers, writing only the ones that changed.
+        """
+        variants = ProductVariant.raw_objects.filter(id__in=variant_ids).prefetch_related(
+            Prefetch('pricing_tiers', queryset=cls.raw_objects.only(*cls.RANGE_FIELDS))
+        )
+        changed = []
+        for variant in variants:
+            status = 'active' if variant.validate_pricing_tiers() else 'draft'
+            if variant.status != status:
+                variant.status = status
+                changed.append(variant)
+        ProductVariant.raw_objects.bulk_update(changed, ['status'])
+
     @classmethod
     def get_appropriate_tier(cls, product_variant, quantity, tier_type='pack'):
         """
         Find the best pricing tier for a given quantity and tier type.
         Returns the most appropriate pricing tier based on the quantity.
         """
-        tiers = cls.objects.filter(
+        tiers = cls.raw_objects.filter(
             product_variant=product_variant,
             tier_type=tier_type
         ).order_by('range_start')
@@ -330,68 +775,25 @@ class PricingTier(models.Model):
         Check if the pricing tiers for the associated ProductVariant meet the conditions to set status='active'.
         """
         try:
-            pricing_tiers = self.product_variant.pricing_tiers.all()
-            if not hasattr(pricing_tiers, '__iter__'):
-                return False
-            pack_tiers = sorted([tier for tier in pricing_tiers if tier.tier_type == 'pack'], 
-                              key=lambda x: x.range_start)
-            pallet_tiers = [tier for tier in pricing_tiers if tier.tier_type == 'pallet']
-
-            # Validate show_units_per settings
-            if self.product_variant.show_units_per == 'pack':
-                if not pack_tiers or pallet_tiers:
-                    return False
-                pack_no_end = [tier for tier in pack_tiers if tier.no_end_range]
-                if len(pack_no_end) != 1:
-                    return False
-                if pack_tiers and pack_tiers[0].range_start != 1:
-                    return False
-                for tier in pack_tiers:
-                    if not tier.no_end_range and tier.range_end is None:
-                        return False
-                for i in range(len(pack_tiers) - 1):
-                    current = pack_tiers[i]
-                    next_tier = pack_tiers[i + 1]
-                    if current.no_end_range:
-                        return False  # No tiers should exist after no_end_range
-                    current_end = current.range_end if current.range_end is not None else float('inf')
-                    if next_tier.range_start != current_end + 1:
-                        return False
-            elif self.product_variant.show_units_per == 'both':
-                if not pack_tiers or not pallet_tiers:
-                    return False
-                pack_no_end = [tier for tier in pack_tiers if tier.no_end_range]
-                if len(pack_no_end) != 1:
-                    return False
-                if len(pallet_tiers) > 1:
-                    return False
-                if pack_tiers and pack_tiers[0].range_start != 1:
-                    return False
-                for tier in pack_tiers:
-                    if not tier.no_end_range and tier.range_end is None:
-                        return False
-                for i in range(len(pack_tiers) - 1):
-                    current = pack_tiers[i]
-                    next_tier = pack_tiers[i + 1]
-                    if current.no_end_range:
-                        return False  # No tiers should exist after no_end_range
-                    current_end = current.range_end if current.range_end is not None else float('inf')
-                    if next_tier.range_start != current_end + 1:
-                        return False
-
-            return True
+            return self.product_variant.validate_pricing_tiers()
         except Exception:
             return False
 
     def save(self, *args, **kwargs):
-        self.full_clean()
+        if not kwargs.pop('skip_validation', False):
+            self.full_clean()
         super().save(*args, **kwargs)
+        bulk_variants = _PRICING_TIER_BULK_VARIANTS.get()
+        if bulk_variants is not None:
+            # pricing_tier_bulk_mode() refreshes the variant status once on exit
+            bulk_variants.add(self.product_variant_id)
+            return
         try:
-            if self.check_pricing_tiers_conditions():
-                self.product_variant.status = 'active'
-            else:
-                self.product_variant.status = 'draft'
-            self.product_variant.save()
+            status = 'active' if self.check_pricing_tiers_conditions() else 'draft'
+            # Only the status changes: write that column, and only when it differs, instead of
+            # re-validating and re-saving the whole variant
+            ProductVariant.raw_objects.filter(pk=self.product_variant_id).exclude(status=status).update(status=status)
+            self.product_variant.status = status
         except Exception:
             pass
 
@@ -401,41 +803,83 @@ class PricingTier(models.Model):
         range_str = f"{self.range_start}-" + ("+" if self.no_end_range else str(self.range_end))
         return f"{self.product_variant} - {self.tier_type} - {range_str}"
 
+# product_variant ids whose tiers were saved inside pricing_tier_bulk_mode()
+_PRICING_TIER_BULK_VARIANTS = ContextVar('pricing_tier_bulk_variants', default=None)
+
+@contextmanager
+def pricing_tier_bulk_mode():
+    """
+    Save a batch of pricing tiers one by one without per-row sibling queries and status updates.
+    On exit the touched variants' tiers are checked together and their statuses refreshed once;
+    the batch runs in a transaction so an invalid one is rolled back.
+    """
+    variant_ids = set()
+    with transaction.atomic():
+        token = _PRICING_TIER_BULK_VARIANTS.set(variant_ids)
+        try:
+            yield
+        finally:
+            _PRICING_TIER_BULK_VARIANTS.reset(token)
+        PricingTier._validate_variant_tiers(variant_ids)
+        PricingTier._refresh_variant_statuses(variant_ids)
+
 @receiver(post_delete, sender=PricingTier)
 def update_product_variant_status_on_delete(sender, instance, **kwargs):
+    bulk_variants = _PRICING_TIER_BULK_VARIANTS.get()
+    if bulk_variants is not None:
+        # pricing_tier_bulk_mode() refreshes the variant status once on exit
+        bulk_variants.add(instance.product_variant_id)
+        return
     try:
-        product_variant = instance.product_variant
-        if not product_variant.pricing_tiers.exists() or not instance.check_pricing_tiers_conditions():
-            product_variant.status = 'draft'
-            product_variant.save()
+        # check_pricing_tiers_conditions() is False when no tiers remain
+        if not instance.check_pricing_tiers_conditions():
+            ProductVariant.raw_objects.filter(pk=instance.product_variant_id).exclude(
+                status='draft'
+            ).update(status='draft')
     except Exception:
         pass
 
-class PricingTierData(models.Model):
+class PricingTierDataManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the item and pricing tier (with their variants, and the tier's product) used by __str__.
+        """
+        return super().get_queryset().select_related('item__product_variant', 'pricing_tier__product_variant__product')
+
+class PricingTierData(BulkImportMixin, models.Model):
     """
     Stores pricing data for an item within a pricing tier, with price per unit.
     """
-    item = models.ForeignKey('Item', on_delete=models.CASCADE, related_name='pricing_tier_data')
-    pricing_tier = models.ForeignKey(PricingTier, on_delete=models.CASCADE, related_name='pricing_data')
+    # Indexed as the leading column of the (item, pricing_tier) unique constraint
+    item = models.ForeignKey('Item', on_delete=models.CASCADE, related_name='pricing_tier_data', db_index=False)
+    # Indexed as the leading column of the (pricing_tier, item) index in Meta
+    pricing_tier = models.ForeignKey(PricingTier, on_delete=models.CASCADE, related_name='pricing_data', db_index=False)
     price = models.DecimalField(max_digits=12, decimal_places=2, help_text="Price per unit")
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = PricingTierDataManager()
+    raw_objects = models.Manager()
 
     class Meta:
-        unique_together = ('item', 'pricing_tier')
+        constraints = [
+            # Price lookups by (item, pricing_tier) read the price from the index itself
+            models.UniqueConstraint(fields=['item', 'pricing_tier'], include=['price'], name='ptd_item_tier_unique'),
+        ]
         indexes = [
-            models.Index(fields=['item', 'pricing_tier']),
-            models.Index(fields=['created_at']),
+            # Replaces the plain pricing_tier FK index: serves the same lookups and cascades, and
+            # answers which items a tier has data for from the index alone
+            models.Index(fields=['pricing_tier', 'item'], name='ptd_tier_item_idx'),
         ]
         verbose_name = 'pricing tier data'
         verbose_name_plural = 'pricing tier data'
 
     def clean(self):
         errors = {}
-        if not self.item:
+        if not self.item_id:
             errors['item'] = "Please select an item for this pricing data."
-        elif not self.pricing_tier:
+        elif not self.pricing_tier_id:
             errors['pricing_tier'] = "Please select a pricing tier for this pricing data."
-        elif self.pricing_tier.product_variant != self.item.product_variant:
+        elif self.pricing_tier.product_variant_id != self.item.product_variant_id:
             errors['pricing_tier'] = "Pricing tier must belong to the same product variant as the item."
         elif self.price is None or self.price <= 0:
             errors['price'] = "Price per unit must be a positive number."
@@ -444,13 +888,135 @@ class PricingTierData(models.Model):
             raise ValidationError(errors)
 
     def save(self, *args, **kwargs):
-        self.full_clean()
+        if not kwargs.pop('skip_validation', False):
+            self.full_clean()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_upsert(cls, objs, batch_size=1000):
+        """
+        Insert pricing data, or update the price of existing (item, pricing_tier) rows, with
+        bulk_create. Validates the batch with one variant lookup per model instead of clean()
+        per row, then refreshes the status of the touched items with a single UPDATE.
+        """
+        objs = list(objs)
+        item_variants = dict(
+            Item.raw_objects.filter(pk__in={obj.item_id for obj in objs}).values_list('pk', 'product_variant_id')
+        )
+        tier_variants = dict(
+            PricingTier.raw_objects.filter(pk__in={obj.pricing_tier_id for obj in objs}).values_list(
+                'pk', 'product_variant_id'
+            )
+        )
+        price_field = cls._meta.get_field('price')
+        errors = {}
+        for index, obj in enumerate(objs):
+            if obj.item_id not in item_variants:
+                errors[f"row {index}"] = ["Please select an item for this pricing data."]
+            elif obj.pricing_tier_id not in tier_variants:
+                errors[f"row {index}"] = ["Please select a pricing tier for this pricing data."]
+            elif tier_variants[obj.pricing_tier_id] != item_variants[obj.item_id]:
+                errors[f"row {index}"] = ["Pricing tier must belong to the same product variant as the item."]
+            elif obj.price is None:
+                errors[f"row {index}"] = ["Price per unit must be a positive number."]
+            else:
+                # The field's max_digits/decimal_places checks, so an oversized price is reported
+                # here rather than failing the whole INSERT
+                try:
+                    obj.price = price_field.clean(obj.price, obj)
+                except ValidationError as e:
+                    errors[f"row {index}"] = e.messages
+                    continue
+                if obj.price <= 0:
+                    errors[f"row {index}"] = ["Price per unit must be a positive number."]
+        if errors:
+            raise ValidationError(errors)
+        keys = [(obj.item_id, obj.pricing_tier_id) for obj in objs]
+        if len(set(keys)) != len(keys):
+            raise ValidationError("Duplicate item, pricing_tier combinations in the import batch.")
+
+        with transaction.atomic():
+            created = cls.objects.bulk_create(
+                objs,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['item', 'pricing_tier'],
+                update_fields=['price'],
+            )
+            # Same rule as Item.save: draft while any tier of the variant lacks pricing data
+            missing_tier = PricingTier.raw_objects.filter(product_variant_id=OuterRef('product_variant_id')).exclude(
+                Exists(cls.raw_objects.filter(item_id=OuterRef(OuterRef('pk')), pricing_tier_id=OuterRef('pk')))
+            )
+            Item.raw_objects.filter(pk__in=item_variants).update(
+                status=Case(When(Exists(missing_tier), then=Value('draft')), default=Value('active'))
+            )
+        return created
+
+    @classmethod
+    def prices_for(cls, lines):
+        """
+        Map (item_id, pricing_tier_id) to price for cart or order lines, read with one query.
+        """
+        lines = list(lines)
+        return {
+            (item_id, pricing_tier_id): price
+            for item_id, pricing_tier_id, price in cls.raw_objects.filter(
+                item_id__in={line.item_id for line in lines},
+                pricing_tier_id__in={line.pricing_tier_id for line in lines},
+            ).values_list('item_id', 'pricing_tier_id', 'price')
+        }
+
+    @classmethod
+    def get_price(cls, item_id, pricing_tier_id):
+        """
+        Price per unit of an item in a pricing tier, or None. Served from preload_pricing_data()
+        when active; other lookups read the price from the (item, pricing_tier) index.
+        """
+        prices = _PRICING_DATA_CACHE.get()
+        key = (item_id, pricing_tier_id)
+        if prices is not None and key in prices:
+            return prices[key]
+        # get() rather than first(): no ORDER BY pk, so the unique constraint serves an index-only point lookup
+        try:
+            price = cls.raw_objects.values_list('price', flat=True).get(
+                item_id=item_id, pricing_tier_id=pricing_tier_id
+            )
+        except cls.DoesNotExist:
+            price = None
+        if prices is not None:
+            prices[key] = price
+        return price
+
     def __str__(self):
         return f"{self.item} - {self.pricing_tier} - Price per unit: {self.price}"
 
-class TableField(models.Model):
+# (item_id, pricing_tier_id) -> price for the lines preloaded by preload_pricing_data()
+_PRICING_DATA_CACHE = ContextVar('pricing_data_cache', default=None)
+
+@contextmanager
+def preload_pricing_data(lines):
+    """
+    Cache the prices of cart or order lines so PricingTierData.get_price() skips its query per line.
+    Nested calls reuse the enclosing cache and only query when it misses some of their lines.
+    """
+    lines = list(lines)
+    prices = _PRICING_DATA_CACHE.get()
+    if prices is None or any((line.item_id, line.pricing_tier_id) not in prices for line in lines):
+        prices = {**(prices or {}), **PricingTierData.prices_for(lines)}
+    token = _PRICING_DATA_CACHE.set(prices)
+    try:
+        yield
+    finally:
+        _PRICING_DATA_CACHE.reset(token)
+
+class TableFieldManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the product variant and product used by __str__ and admin lists.
+        """
+        return super().get_queryset().select_related('product_variant__product')
+
+class TableField(BulkImportMixin, models.Model):
     """
     Defines custom fields for product variants to store additional item data.
     """
@@ -459,23 +1025,24 @@ class TableField(models.Model):
         ('number', 'Number'),
         ('image', 'Image'),
     )
-    RESERVED_NAMES = [
+    FIELD_TYPE_VALUES = frozenset(value for value, _ in FIELD_TYPES)
+    RESERVED_NAMES = frozenset([
         'title', 'status', 'is_physical_product', 'weight', 'weight_unit',
         'track_inventory', 'stock', 'sku', 'image'
-    ]
+    ])
 
-    product_variant = models.ForeignKey(ProductVariant, on_delete=models.CASCADE, related_name='table_fields')
+    # Indexed as the leading column of unique_together
+    product_variant = models.ForeignKey(ProductVariant, on_delete=models.CASCADE, related_name='table_fields', db_index=False)
     name = models.CharField(max_length=255)
     field_type = models.CharField(max_length=20, choices=FIELD_TYPES, db_index=True)
     long_field = models.BooleanField(default=False, help_text="Check if this field requires more display space (e.g., for long text)")
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = TableFieldManager()
+    raw_objects = models.Manager()
 
     class Meta:
         unique_together = ('product_variant', 'name')
-        indexes = [
-            models.Index(fields=['product_variant', 'name']),
-            models.Index(fields=['field_type']),
-        ]
         verbose_name = 'table field'
         verbose_name_plural = 'table fields'
 
@@ -487,20 +1054,40 @@ class TableField(models.Model):
             errors['name'] = f"The name '{self.name}' is reserved and cannot be used."
         elif not self.field_type:
             errors['field_type'] = "Please select a field type for the table field."
-        elif not self.product_variant:
+        elif not self.product_variant_id:
             errors['product_variant'] = "Please select a product variant for the table field."
 
         if errors:
             raise ValidationError(errors)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
     def save(self, *args, **kwargs):
-        self.full_clean()
+        if not kwargs.pop('skip_validation', False):
+            # The (product_variant, name) uniqueness query is only needed when that pair changed
+            loaded = getattr(self, '_loaded_values', None)
+            unchanged = bool(loaded) and (
+                loaded.get('product_variant_id') == self.product_variant_id and loaded.get('name') == self.name
+            )
+            self.full_clean(validate_unique=not unchanged)
         super().save(*args, **kwargs)
+        _remember_saved_values(self, kwargs.get('update_fields'))
 
     def __str__(self):
         return f"{self.product_variant.name} - {self.name} ({self.field_type}, {'Long' if self.long_field else 'Short'})"
 
-class Item(models.Model):
+class ItemManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the product variant and product used by __str__, admin lists and serializers.
+        """
+        return super().get_queryset().select_related('product_variant__product')
+
+class Item(BulkImportMixin, models.Model):
     """
     Represents a specific item within a product variant with attributes like SKU, stock, and dimensions.
     """
@@ -520,8 +1107,19 @@ class Item(models.Model):
         ('IN', 'Inches'),
         ('M', 'Meters'),
     )
+    # Columns rendered by list views; see for_listing()
+    LIST_FIELDS = (
+        'id', 'product_variant', 'sku', 'status', 'is_physical_product',
+        'track_inventory', 'stock', 'units_per_pack', 'created_at',
+    )
 
-    product_variant = models.ForeignKey('ProductVariant', on_delete=models.CASCADE, related_name='items', null=False, blank=False)
+    # Indexed as the leading column of item_variant_status_cover
+    product_variant = models.ForeignKey('ProductVariant', on_delete=models.CASCADE, related_name='items', null=False, blank=False, db_index=False)
+    # Copies of product_variant.product and its category, kept in sync by save() and the
+    # ProductVariant/Product post_save receivers, so reports can filter items without joins
+    product = models.ForeignKey('Product', on_delete=models.CASCADE, related_name='items', null=True, editable=False)
+    # Indexed as the leading column of item_category_status_idx
+    category = models.ForeignKey('Category', on_delete=models.CASCADE, related_name='items', null=True, editable=False, db_index=False)
     title = models.CharField(max_length=255, blank=True, null=True)
     sku = models.CharField(max_length=100, unique=True)
     is_physical_product = models.BooleanField(default=False)
@@ -561,12 +1159,40 @@ class Item(models.Model):
     )
     units_per_pack = models.PositiveIntegerField(validators=[MinValueValidator(1)], default=1)
 
+    objects = ItemManager()
+    raw_objects = models.Manager()
+
     class Meta:
         indexes = [
-            models.Index(fields=['product_variant']),
-            models.Index(fields=['sku']),
-            models.Index(fields=['status']),
-            models.Index(fields=['created_at']),
+            # Variant item listings on product pages
+            models.Index(fields=['product_variant', 'status'], include=['sku', 'title'], name='item_variant_status_cover'),
+            models.Index(fields=['product_variant', 'stock'], condition=Q(track_inventory=True), name='item_tracked_stock_idx'),
+            models.Index(fields=['category', 'status'], name='item_category_status_idx'),
+        ]
+        # Database-side guards for the rules clean() enforces and normalizes in Python
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    Q(is_physical_product=True, weight__isnull=False, weight__gt=0, weight_unit__isnull=False)
+                    | Q(is_physical_product=False, weight__isnull=True, weight_unit__isnull=True)
+                ),
+                name='item_physical_consistency',
+                violation_error_message="Physical products need a positive weight and a weight unit; other items must have neither.",
+            ),
+            models.CheckConstraint(
+                condition=(
+                    Q(track_inventory=True, stock__isnull=False, stock__gte=0, title__isnull=False) & ~Q(title='')
+                    | Q(track_inventory=False, stock__isnull=True)
+                ),
+                name='item_inventory_consistency',
+                violation_error_message="Tracked items need a non-negative stock and a title; untracked items must have no stock.",
+            ),
+            # NULLIF leaves the check unknown (passing) when units_per_pack is 0, as clean() skips it
+            models.CheckConstraint(
+                condition=Q(Exact(Mod('stock', NullIf('units_per_pack', Value(0))), Value(0))) | Q(stock__isnull=True),
+                name='item_stock_whole_packs',
+                violation_error_message="Stock must be a multiple of units per pack.",
+            ),
         ]
         verbose_name = 'item'
         verbose_name_plural = 'items'
@@ -577,21 +1203,19 @@ class Item(models.Model):
         """
         if value is None:
             return None
-        value = Decimal(str(value))  # Ensure value is a Decimal
-        if unit == 'MM':
-            return (value * Decimal('0.0393701')).quantize(Decimal('0.01'))
-        elif unit == 'CM':
-            return (value * Decimal('0.393701')).quantize(Decimal('0.01'))
-        elif unit == 'M':
-            return (value * Decimal('39.3701')).quantize(Decimal('0.01'))
-        elif unit == 'IN':
-            return value.quantize(Decimal('0.01'))
-        return None
+        factor = _INCHES_PER_UNIT.get(unit)
+        if factor is None:
+            return None
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))  # Ensure value is a Decimal
+        return (value * factor).quantize(_CENT)
 
     def clean(self):
         errors = {}
 
-        # Validate SKU
+        # Validate SKU, normalized so exact lookups hit a deterministic key
+        if self.sku:
+            self.sku = self.sku.strip().upper()
         if not self.sku:
             errors['sku'] = "SKU is required."
 
@@ -607,22 +1231,8 @@ class Item(models.Model):
             if self.product_variant.show_units_per == 'both' and not self.is_physical_product:
                 errors['is_physical_product'] = "Item must be a physical product when product variant show units per is set to 'both'."
 
-            # Safely access related objects for category-based validation
-            try:
-                category_name = self.product_variant.product.category.name.lower() if (
-                    self.product_variant and 
-                    hasattr(self.product_variant, 'product') and 
-                    self.product_variant.product and 
-                    hasattr(self.product_variant.product, 'category') and 
-                    self.product_variant.product.category
-                ) else ''
-            except AttributeError as e:
-                errors['product_variant'] = "Invalid product variant: related product or category is missing."
-                raise ValidationError(errors) from e
-
             # Category-based validation for dimensions
-            required_categories = ['box', 'boxes', 'postal', 'postals', 'bag', 'bags']
-            if category_name in required_categories:
+            if self.product_variant.requires_dimensions:
                 if self.height is None or self.height <= 0:
                     errors['height'] = "Height must be a positive number for this category."
                 if self.width is None or self.width <= 0:
@@ -631,7 +1241,7 @@ class Item(models.Model):
                     errors['length'] = "Length must be a positive number for this category."
                 if not self.measurement_unit:
                     errors['measurement_unit'] = "Please select a measurement unit for this category."
-                if self.measurement_unit and self.measurement_unit not in ['MM', 'CM', 'IN', 'M']:
+                if self.measurement_unit and self.measurement_unit not in _MEASUREMENT_UNITS:
                     errors['measurement_unit'] = "Please select a valid measurement unit (MM, CM, IN, M)."
             else:
                 # Only clear dimensions if they are not provided or invalid
@@ -639,7 +1249,7 @@ class Item(models.Model):
                    any([self.height is not None and self.height <= 0,
                         self.width is not None and self.width <= 0,
                         self.length is not None and self.length <= 0,
-                        self.measurement_unit and self.measurement_unit not in ['MM', 'CM', 'IN', 'M']]):
+                        self.measurement_unit and self.measurement_unit not in _MEASUREMENT_UNITS]):
                     self.height = None
                     self.width = None
                     self.length = None
@@ -651,9 +1261,7 @@ class Item(models.Model):
             # Validate PricingTierData entries for status
             if self.pk and self.status == 'active':
                 try:
-                    pricing_tiers = self.product_variant.pricing_tiers.all()
-                    existing_pricing_data = set(self.pricing_tier_data.values_list('pricing_tier_id', flat=True))
-                    missing_tiers = [tier for tier in pricing_tiers if tier.id not in existing_pricing_data]
+                    missing_tiers = list(self.missing_pricing_tiers())
                     if missing_tiers:
                         missing_tier_names = [f"{tier.tier_type} ({tier.range_start}-{'+' if tier.no_end_range else tier.range_end})" for tier in missing_tiers]
                         errors['status'] = f"Cannot set status to 'Active'. Missing pricing data for: {', '.join(missing_tier_names)}."
@@ -691,9 +1299,42 @@ class Item(models.Model):
                 raise ValidationError(errors)
 
     def save(self, *args, **kwargs):
-        # Perform validation first
-        self.full_clean()
+        # Perform validation first, unless the caller already validated the instance
+        if not kwargs.pop('skip_validation', False):
+            # The sku uniqueness query is only needed when the sku changed. clean() upper-cases it,
+            # so compare the normalized value: a legacy lower-case sku is rewritten and must be checked
+            loaded = getattr(self, '_loaded_values', None)
+            # clean() already enforces the item_* check constraints without a query per constraint;
+            # product and category are copied from product_variant below
+            self.full_clean(
+                exclude=['product', 'category'],
+                validate_unique=not (loaded and loaded.get('sku') == (self.sku or '').strip().upper()),
+                validate_constraints=False,
+            )
+
+        self._set_dimensions_in_inches()
 
+        if self.product_variant_id:
+            self.product_id = self.product_variant.product_id
+            self.category_id = self.product_variant.product.category_id
+
+        # Derive status from pricing tier data before writing, so the row is saved once
+        try:
+            if self._state.adding:
+                # A new item has no pricing data yet: it is a draft whenever its variant has tiers
+                has_missing = PricingTier.raw_objects.filter(product_variant_id=self.product_variant.pk).exists()
+            else:
+                has_missing = self.missing_pricing_tiers().exists()
+            self.status = 'draft' if has_missing else 'active'
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'status'}
+        except AttributeError:
+            pass
+
+        super().save(*args, **kwargs)
+        _remember_saved_values(self, kwargs.get('update_fields'))
+
+    def _set_dimensions_in_inches(self):
         # Convert dimensions to inches if measurement_unit is set
         if self.measurement_unit and self.height is not None and self.width is not None and self.length is not None:
             self.height_in_inches = self.convert_to_inches(self.height, self.measurement_unit)
@@ -704,18 +1345,50 @@ class Item(models.Model):
             self.width_in_inches = None
             self.length_in_inches = None
 
-        # Save the instance
-        super().save(*args, **kwargs)
+    @classmethod
+    def bulk_import(cls, objs, batch_size=1000):
+        """
+        Create new items without a save() per row. Their variants (with product and category)
+        are loaded with one query and shared by the rows, and since new items have no pricing
+        data the status is draft exactly when the variant has pricing tiers.
+        """
+        objs = list(objs)
+        variants = ProductVariant.objects.in_bulk({obj.product_variant_id for obj in objs if obj.product_variant_id})
+        variants_with_tiers = set(
+            PricingTier.raw_objects.filter(product_variant_id__in=variants).values_list('product_variant_id', flat=True)
+        )
+        for obj in objs:
+            variant = variants.get(obj.product_variant_id)
+            if variant is not None:
+                obj.product_variant = variant
+                obj.product = variant.product
+                obj.category = variant.product.category
+                obj.status = 'draft' if variant.pk in variants_with_tiers else 'active'
+            # clean() clears the converted dimensions along with any it discards
+            obj._set_dimensions_in_inches()
+        return super().bulk_import(objs, batch_size=batch_size)
+
+    def missing_pricing_tiers(self):
+        """
+        The variant's pricing tiers without PricingTierData for this item, as one anti-join query.
+        """
+        return PricingTier.raw_objects.filter(
+            product_variant_id=self.product_variant.pk
+        ).exclude(pricing_data__item_id=self.pk).only(*PricingTier.RANGE_FIELDS)
 
-        # Update status based on pricing tier data
-        if self.pk:
-            try:
-                pricing_tiers = self.product_variant.pricing_tiers.all()
-                existing_pricing_data = set(self.pricing_tier_data.values_list('pricing_tier_id', flat=True))
-                self.status = 'active' if all(tier.id in existing_pricing_data for tier in pricing_tiers) else 'draft'
-                super().save(update_fields=['status'])
-            except AttributeError:
-                pass
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    @classmethod
+    def for_listing(cls, queryset=None):
+        """
+        Restrict a queryset (all items by default) to LIST_FIELDS.
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        return queryset.only(*cls.LIST_FIELDS)
 
     def delete(self, *args, **kwargs):
         """Delete associated images before deleting the item."""
@@ -731,141 +1404,308 @@ class Item(models.Model):
     def __str__(self):
         return f"Item {self.sku} for {self.product_variant.name} ({self.status})"
 
-class ItemImage(models.Model):
+class ItemImageManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the item and its variant used by __str__.
+        """
+        return super().get_queryset().select_related('item__product_variant')
+
+class ItemImage(BulkImportMixin, models.Model):
     """
     Stores images associated with an item.
     """
-    item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name='images')
-    image = models.ImageField(upload_to='item_images/')
+    # Required-field messages are raised by clean_fields() from the id and file name, without
+    # loading the related row or opening the file (ForeignKey.validate still runs its existence query)
+    item = models.ForeignKey(
+        Item, on_delete=models.CASCADE, related_name='images',
+        error_messages={'null': "Please select an item for this image."},
+    )
+    image = models.ImageField(
+        upload_to='item_images/',
+        error_messages={'blank': "Please upload an image for the item."},
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ItemImageManager()
+    raw_objects = models.Manager()
+
     class Meta:
-        indexes = [
-            models.Index(fields=['item']),
-        ]
         verbose_name = 'item image'
         verbose_name_plural = 'item images'
 
-    def clean(self):
-        errors = {}
-        if not self.item:
-            errors['item'] = "Please select an item for this image."
-        elif not self.image:
-            errors['image'] = "Please upload an image for the item."
-
-        if errors:
-            raise ValidationError(errors)
-
     def save(self, *args, **kwargs):
-        self.full_clean()
+        if not kwargs.pop('skip_validation', False):
+            self.full_clean()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_create_images(cls, item, files, batch_size=200):
+        """
+        Add uploaded files to item with one validation pass and batched INSERTs;
+        bulk_create stores each file when its row is written.
+        """
+        return cls.bulk_import([cls(item=item, image=file) for file in files], batch_size=batch_size)
+
     def __str__(self):
         return f"Image for {self.item}"
 
-class ItemData(models.Model):
+def _validate_text(field_name, value_text, value_number, value_image):
+    if value_text is None:
+        return {'value_text': f"Please provide a value for the text field '{field_name}'."}
+    if value_number is not None or value_image:
+        return {'value_text': f"Field '{field_name}' only accepts text values."}
+    return {}
+
+def _validate_number(field_name, value_text, value_number, value_image):
+    if value_number is None:
+        return {'value_number': f"Please provide a number for the field '{field_name}'."}
+    if value_text is not None or value_image:
+        return {'value_number': f"Field '{field_name}' only accepts number values."}
+    return {}
+
+def _validate_image(field_name, value_text, value_number, value_image):
+    if not value_image:
+        return {'value_image': f"Please upload an image for the field '{field_name}'."}
+    if value_text is not None or value_number is not None:
+        return {'value_image': f"Field '{field_name}' only accepts image values."}
+    return {}
+
+# ItemData value validators keyed by TableField.field_type
+_ITEMDATA_VALIDATORS = {
+    'text': _validate_text,
+    'number': _validate_number,
+    'image': _validate_image,
+}
+
+# field_id -> (field_type, name) for the table fields preloaded by preload_field_types()
+_FIELD_TYPE_CACHE = ContextVar('field_type_cache', default=None)
+
+@contextmanager
+def preload_field_types(product_variant_id):
+    """
+    Cache the table field types of a product variant so ItemData.clean can skip the TableField fetch.
+    """
+    fields = TableField.raw_objects.filter(product_variant_id=product_variant_id).values_list('id', 'field_type', 'name')
+    token = _FIELD_TYPE_CACHE.set({field_id: (field_type, name) for field_id, field_type, name in fields})
+    try:
+        yield
+    finally:
+        _FIELD_TYPE_CACHE.reset(token)
+
+class ItemDataManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the table field and item (with its variant) used by __str__.
+        """
+        return super().get_queryset().select_related('field', 'item__product_variant')
+
+class ItemData(BulkImportMixin, models.Model):
     """
     Stores additional data for an item based on table fields (e.g., text, number, image).
     """
-    item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name='data_entries')
+    # Indexed as the leading column of unique_together
+    item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name='data_entries', db_index=False)
     field = models.ForeignKey(TableField, on_delete=models.CASCADE, related_name='data_values')
+    # Copy of item.product_variant, kept in sync by save(), bulk_import() and the Item post_save receiver
+    product_variant = models.ForeignKey(ProductVariant, on_delete=models.CASCADE, related_name='item_data', null=True, editable=False)
     value_text = models.TextField(blank=True, null=True)
     value_number = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
     value_image = models.ImageField(upload_to='item_data_images/', blank=True, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = ItemDataManager()
+    raw_objects = models.Manager()
 
     class Meta:
         unique_together = ('item', 'field')
         indexes = [
-            models.Index(fields=['item', 'field']),
-            models.Index(fields=['created_at']),
+            # Numeric rollups per table field read value_number from the index alone
+            models.Index(
+                fields=['field', 'item'],
+                include=['value_number'],
+                condition=models.Q(value_number__isnull=False),
+                name='itemdata_number_idx',
+            ),
         ]
         verbose_name = 'item data'
         verbose_name_plural = 'item data'
 
     def clean(self):
         errors = {}
-        if not self.field:
+        if not self.field_id:
             errors['field'] = "Please select a table field for this data."
-        elif not self.item:
+        elif not self.item_id:
             errors['item'] = "Please select an item for this data."
 
-        if self.value_text == '':
-            self.value_text = None
-        if self.value_number == '':
-            self.value_number = None
-        if self.value_image == '':
-            self.value_image = None
-
-        if self.field:
-            if self.field.field_type == 'text':
-                if self.value_text is None:
-                    errors['value_text'] = f"Please provide a value for the text field '{self.field.name}'."
-                elif self.value_number is not None or self.value_image:
-                    errors['value_text'] = f"Field '{self.field.name}' only accepts text values."
-            elif self.field.field_type == 'number':
-                if self.value_number is None:
-                    errors['value_number'] = f"Please provide a number for the field '{self.field.name}'."
-                elif self.value_text is not None or self.value_image:
-                    errors['value_number'] = f"Field '{self.field.name}' only accepts number values."
-            elif self.field.field_type == 'image':
-                if not self.value_image:
-                    errors['value_image'] = f"Please upload an image for the field '{self.field.name}'."
-                elif self.value_text is not None or self.value_number is not None:
-                    errors['value_image'] = f"Field '{self.field.name}' only accepts image values."
+        for attr in ('value_text', 'value_number', 'value_image'):
+            if getattr(self, attr) == '':
+                setattr(self, attr, None)
+
+        if self.field_id:
+            field_types = _FIELD_TYPE_CACHE.get()
+            cached = field_types.get(self.field_id) if field_types else None
+            if cached:
+                field_type, field_name = cached
+            else:
+                field_type, field_name = self.field.field_type, self.field.name
+            errors.update(self.validate_value(field_type, field_name, self.value_text, self.value_number, self.value_image))
 
         if errors:
             raise ValidationError(errors)
 
+    @staticmethod
+    def validate_value(field_type, field_name, value_text, value_number, value_image):
+        """
+        Check the values against the table field type; returns an errors dict keyed by value attribute.
+        """
+        validator = _ITEMDATA_VALIDATORS.get(field_type)
+        if validator is None:
+            return {}
+        return validator(field_name, value_text, value_number, value_image)
+
     def save(self, *args, **kwargs):
-        self.full_clean()
+        if not kwargs.pop('skip_validation', False):
+            self.full_clean()
+        if self.item_id:
+            self.product_variant_id = self.item.product_variant_id
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_import(cls, objs, batch_size=1000):
+        objs = list(objs)
+        item_ids = {obj.item_id for obj in objs if obj.item_id}
+        variant_ids = dict(Item.raw_objects.filter(id__in=item_ids).values_list('id', 'product_variant_id'))
+        for obj in objs:
+            obj.product_variant_id = variant_ids.get(obj.item_id)
+        return super().bulk_import(objs, batch_size=batch_size)
+
     def __str__(self):
         if self.field.field_type == 'image' and self.value_image:
             return f"{self.item} - {self.field.name}: {self.value_image.url}"
         return f"{self.item} - {self.field.name}: {self.value_text or self.value_number or '-'}"
 
+def _remember_saved_values(instance, update_fields=None):
+    """
+    Record the values just written in the instance's _loaded_values snapshot, so a later save of
+    the same instance compares against what is in the database, not what it was loaded with.
+    """
+    fields = instance._meta.concrete_fields
+    if update_fields is not None:
+        update_fields = set(update_fields)
+        fields = [f for f in fields if f.name in update_fields or f.attname in update_fields]
+    deferred = instance.get_deferred_fields()
+    loaded = instance.__dict__.setdefault('_loaded_values', {})
+    loaded.update({f.attname: getattr(instance, f.attname) for f in fields if f.attname not in deferred})
+
+def _loaded_value_changed(instance, attname, created):
+    loaded = getattr(instance, '_loaded_values', None)
+    return not created and loaded is not None and attname in loaded and loaded[attname] != getattr(instance, attname)
+
+@receiver(post_save, sender=Category)
+def sync_variant_requires_dimensions(sender, instance, created, **kwargs):
+    if not created:
+        requires_dimensions = instance.requires_dimensions
+        ProductVariant.raw_objects.filter(product__category=instance).exclude(
+            requires_dimensions=requires_dimensions
+        ).update(requires_dimensions=requires_dimensions)
+
+@receiver(post_save, sender=Product)
+def sync_item_category(sender, instance, created, **kwargs):
+    if _loaded_value_changed(instance, 'category_id', created):
+        Item.raw_objects.filter(product=instance).update(category_id=instance.category_id)
+        ProductVariant.raw_objects.filter(product=instance).update(
+            requires_dimensions=instance.category.requires_dimensions
+        )
+        instance._loaded_values['category_id'] = instance.category_id
+
+@receiver(post_save, sender=ProductVariant)
+def sync_item_product(sender, instance, created, **kwargs):
+    if _loaded_value_changed(instance, 'product_id', created):
+        Item.raw_objects.filter(product_variant=instance).update(
+            product_id=instance.product_id, category_id=instance.product.category_id
+        )
+        instance._loaded_values['product_id'] = instance.product_id
+
+@receiver(post_save, sender=Item)
+def sync_item_data_variant(sender, instance, created, **kwargs):
+    if _loaded_value_changed(instance, 'product_variant_id', created):
+        ItemData.raw_objects.filter(item=instance).update(product_variant_id=instance.product_variant_id)
+        instance._loaded_values['product_variant_id'] = instance.product_variant_id
+
+class UserExclusivePriceManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the user and item (with its variant) used by __str__.
+        """
+        return super().get_queryset().select_related('user', 'item__product_variant')
+
 class UserExclusivePrice(models.Model):
     """
     Stores exclusive discount percentages for specific users and items.
     """
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    # Indexed as the leading column of the (user, item) unique constraint
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False)
     item = models.ForeignKey(Item, on_delete=models.CASCADE)
     discount_percentage = models.DecimalField(max_digits=5, decimal_places=2, help_text="Discount percentage")
+    # 1 - discount_percentage / 100, computed by the database on write so price reads just multiply
+    price_multiplier = models.GeneratedField(
+        expression=Value(Decimal('1')) - F('discount_percentage') * Value(_CENT),
+        output_field=models.DecimalField(max_digits=5, decimal_places=4),
+        db_persist=True,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = UserExclusivePriceManager()
+    raw_objects = models.Manager()
+
     class Meta:
-        unique_together = ('user', 'item')
-        indexes = [
-            models.Index(fields=['user', 'item']),
-            models.Index(fields=['created_at']),
+        constraints = [
+            # Also serves (user, item) lookups, so no separate index is kept
+            models.UniqueConstraint(fields=['user', 'item'], name='uep_user_item_unique'),
+            models.CheckConstraint(
+                condition=models.Q(discount_percentage__gte=0) & models.Q(discount_percentage__lte=100),
+                name='uep_discount_range',
+                violation_error_message="Discount percentage must be between 0 and 100.",
+            ),
         ]
         verbose_name = 'user exclusive price'
         verbose_name_plural = 'user exclusive prices'
 
     def clean(self):
+        # The 0-100 discount range is checked by the uep_discount_range constraint in full_clean()
         errors = {}
-        if not self.user:
+        if not self.user_id:
             errors['user'] = "Please select a user for this exclusive price."
-        elif not self.item:
+        elif not self.item_id:
             errors['item'] = "Please select an item for this exclusive price."
-        elif self.discount_percentage is None or self.discount_percentage < 0 or self.discount_percentage > 100:
-            errors['discount_percentage'] = "Discount percentage must be between 0 and 100."
 
         if errors:
             raise ValidationError(errors)
 
     def save(self, *args, **kwargs):
-        self.full_clean()
+        if not kwargs.pop('skip_validation', False):
+            self.full_clean()
+        adding = self._state.adding
         super().save(*args, **kwargs)
+        if not adding:
+            # Inserts return the generated price_multiplier; after an update reload it on next access
+            self.__dict__.pop('price_multiplier', None)
 
     def __str__(self):
         return f"{self.user.email} - {self.item} ({self.discount_percentage}% off)"
 
 
+class CartItemManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the item, pricing tier and exclusive price read by clean(), totals and serializers.
+        """
+        return super().get_queryset().select_related('item', 'pricing_tier', 'user_exclusive_price')
+
 class CartItem(models.Model):
-    cart = models.ForeignKey('Cart', on_delete=models.CASCADE, related_name='items')
+    # Indexed as the leading column of unique_together
+    cart = models.ForeignKey('Cart', on_delete=models.CASCADE, related_name='items', db_index=False)
     item = models.ForeignKey('Item', on_delete=models.PROTECT, related_name='cart_items')
     pricing_tier = models.ForeignKey('PricingTier', on_delete=models.PROTECT, related_name='cart_items')
     pack_quantity = models.PositiveIntegerField()
@@ -877,46 +1717,45 @@ class CartItem(models.Model):
     )
     user_exclusive_price = models.ForeignKey('UserExclusivePrice', on_delete=models.SET_NULL, null=True, blank=True,
                                           related_name='cartitem_items')
+    # Copy of item.units_per_pack, set by save() and kept in sync by the Item post_save receiver;
+    # null for rows saved before it was added
+    units_per_pack = models.PositiveIntegerField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CartItemManager()
+    raw_objects = models.Manager()
+
     class Meta:
-        indexes = [
-            models.Index(fields=['cart', 'item']),
-            models.Index(fields=['pricing_tier']),
-            models.Index(fields=['created_at']),
-        ]
         unique_together = ('cart', 'item', 'pricing_tier', 'unit_type')
         verbose_name = 'cart item'
         verbose_name_plural = 'cart items'
 
     def convert_weight_to_kg(self, weight, weight_unit):
         if weight is None or weight_unit is None:
-            return Decimal('0.00')
-        weight = Decimal(str(weight))
-        if weight_unit == 'lb':
-            return (weight * Decimal('0.453592')).quantize(Decimal('0.01'))
-        elif weight_unit == 'oz':
-            return (weight * Decimal('0.0283495')).quantize(Decimal('0.01'))
-        elif weight_unit == 'g':
-            return (weight * Decimal('0.001')).quantize(Decimal('0.01'))
-        elif weight_unit == 'kg':
-            return weight.quantize(Decimal('0.01'))
-        return Decimal('0.00')
+            return _ZERO
+        factor = _KG_PER_WEIGHT_UNIT.get(weight_unit)
+        if factor is None:
+            return _ZERO
+        return (Decimal(str(weight)) * factor).quantize(_CENT)
+
+    def get_units_per_pack(self):
+        if self.units_per_pack is None:
+            return self.item.units_per_pack or 1
+        return self.units_per_pack
 
     @property
     def total_units(self):
-        if not self.item:
+        if not self.item_id:
             return 0
-        units_per_pack = self.item.units_per_pack or 1
-        return self.pack_quantity * units_per_pack
+        return self.pack_quantity * self.get_units_per_pack()
 
     @property
     def total_weight_kg(self):
         if not self.item:
-            return Decimal('0.00')
+            return _ZERO
         item_weight_kg = self.convert_weight_to_kg(self.item.weight, self.item.weight_unit)
-        return (item_weight_kg * Decimal(self.total_units)).quantize(Decimal('0.01'))
+        return (item_weight_kg * self.total_units).quantize(_CENT)
 
     def get_appropriate_pricing_tier(self):
         from .models import PricingTier
@@ -938,7 +1777,7 @@ class CartItem(models.Model):
             errors['pack_quantity'] = "Pack quantity must be a positive number."
 
         if self.item and self.pricing_tier:
-            if self.pricing_tier.product_variant != self.item.product_variant:
+            if self.pricing_tier.product_variant_id != self.item.product_variant_id:
                 errors['pricing_tier'] = "Pricing tier must belong to the same product variant as the item."
 
             if self.pack_quantity < self.pricing_tier.range_start:
@@ -955,19 +1794,17 @@ class CartItem(models.Model):
             if self.item.track_inventory:
                 total_units = self.total_units
                 available_stock = self.item.stock
-                
-                units_per_pack = self.item.units_per_pack or 1
-                
-                existing_cart_units = CartItem.objects.filter(
-                    cart=self.cart,
-                    item=self.item
-                ).exclude(pk=self.pk).aggregate(
-                    total=Sum('pack_quantity') * units_per_pack
-                )['total'] or 0
-                
-                available_for_new = max(0, available_stock - existing_cart_units)
-                
+
                 if available_stock is None or total_units > available_stock:
+                    # The other lines of this item only feed the message, so sum them on failure alone
+                    units_per_pack = self.item.units_per_pack or 1
+                    existing_cart_units = CartItem.raw_objects.filter(
+                        cart_id=self.cart_id,
+                        item_id=self.item_id
+                    ).exclude(pk=self.pk).aggregate(
+                        total=Sum('pack_quantity') * units_per_pack
+                    )['total'] or 0
+                    available_for_new = max(0, (available_stock or 0) - existing_cart_units)
                     errors['pack_quantity'] = (
                         f"Insufficient stock for {self.item.sku}. "
                         f"Total available: {available_stock or 0} units, "
@@ -977,9 +1814,9 @@ class CartItem(models.Model):
                     )
 
         if self.user_exclusive_price:
-            if self.item and self.user_exclusive_price.item != self.item:
+            if self.item and self.user_exclusive_price.item_id != self.item_id:
                 errors['user_exclusive_price'] = "User exclusive price must correspond to the selected item."
-            if self.cart and self.user_exclusive_price.user != self.cart.user:
+            if self.cart and self.user_exclusive_price.user_id != self.cart.user_id:
                 errors['user_exclusive_price'] = "User exclusive price must correspond to the cart's user."
 
         if errors:
@@ -988,8 +1825,10 @@ class CartItem(models.Model):
     def save(self, *args, **kwargs):
         from django.db import transaction
         
+        skip_validation = kwargs.pop('skip_validation', False)
         if not self.item:
             raise ValidationError({"item": "CartItem cannot be saved without an item."})
+        self.units_per_pack = self.item.units_per_pack
 
         with transaction.atomic():
             existing_cart_item = CartItem.objects.filter(
@@ -1007,12 +1846,14 @@ class CartItem(models.Model):
                     
                 existing_cart_item.pricing_tier = self.pricing_tier
                 existing_cart_item.user_exclusive_price = self.user_exclusive_price
+                # The caller validated this line, not the merged one
                 existing_cart_item.full_clean()
-                existing_cart_item.save(*args, **kwargs)
+                existing_cart_item.save(*args, skip_validation=True, **kwargs)
                 self.pk = existing_cart_item.pk
                 cart_item = existing_cart_item
             else:
-                self.full_clean()
+                if not skip_validation:
+                    self.full_clean()
                 super().save(*args, **kwargs)
                 cart_item = self
 
@@ -1047,10 +1888,6 @@ class Cart(models.Model):
     )
 
     class Meta:
-        indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['created_at']),
-        ]
         verbose_name = 'cart'
         verbose_name_plural = 'carts'
 
@@ -1075,7 +1912,7 @@ class Cart(models.Model):
             
             if unit_type == 'pallet' and existing_pack_item:
                 # Convert existing pack quantity to pallet equivalent
-                units_per_pallet = existing_pack_item.item.units_per_pack or 1
+                units_per_pallet = existing_pack_item.get_units_per_pack()
                 pallet_quantity = math.ceil(existing_pack_item.pack_quantity / units_per_pallet)
                 
                 # Sum with new pallet quantity
@@ -1100,7 +1937,7 @@ class Cart(models.Model):
                 existing_pallet_item.pricing_tier = pricing_tier
                 existing_pallet_item.user_exclusive_price = item_data.get('user_exclusive_price', existing_pallet_item.user_exclusive_price)
                 existing_pallet_item.full_clean()
-                existing_pallet_item.save()
+                existing_pallet_item.save(skip_validation=True)
                 self.update_pricing_tiers()
                 return existing_pallet_item
             else:
@@ -1110,7 +1947,7 @@ class Cart(models.Model):
                 existing_item.pricing_tier = pricing_tier
                 existing_item.user_exclusive_price = item_data.get('user_exclusive_price', existing_item.user_exclusive_price)
                 existing_item.full_clean()
-                existing_item.save()
+                existing_item.save(skip_validation=True)
                 self.update_pricing_tiers()
                 return existing_item
         else:
@@ -1124,46 +1961,46 @@ class Cart(models.Model):
             return new_item
 
     def calculate_subtotal(self):
-        total = Decimal('0.00')
-        for item in self.items.all():
-            pricing_data = PricingTierData.objects.filter(pricing_tier=item.pricing_tier, item=item.item).first()
-            if pricing_data and item.item:
-                units_per_pack = item.item.units_per_pack or 1
-                per_pack_price = pricing_data.price * Decimal(units_per_pack)
-                item_subtotal = per_pack_price * Decimal(item.pack_quantity)
-                if item.user_exclusive_price:
-                    discount_percentage = item.user_exclusive_price.discount_percentage
-                    discount = discount_percentage / Decimal('100.00')
-                    item_subtotal = item_subtotal * (Decimal('1.00') - discount)
-                total += item_subtotal.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        return total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        total = _ZERO
+        # CartItemManager joins the item, pricing tier and exclusive price of every line
+        cart_items = list(self.items.all())
+        prices = PricingTierData.prices_for(cart_items)
+        for item in cart_items:
+            price = prices.get((item.item_id, item.pricing_tier_id))
+            if price is not None and item.item_id:
+                per_pack_price = price * item.get_units_per_pack()
+                item_subtotal = per_pack_price * item.pack_quantity
+                uep = item.user_exclusive_price
+                if uep is not None and uep.discount_percentage:
+                    item_subtotal = (item_subtotal * uep.price_multiplier).quantize(_CENT, rounding=ROUND_HALF_UP)
+                # Undiscounted lines are whole cents already: a 2 dp price times ints
+                total += item_subtotal
+        return total.quantize(_CENT, rounding=ROUND_HALF_UP)
 
     def calculate_total_units_and_packs(self):
-        total_units = 0
-        total_packs = 0
-        for item in self.items.all():
-            units_per_pack = item.item.units_per_pack or 1
-            total_units += item.pack_quantity * units_per_pack
-            total_packs += item.pack_quantity
-        return total_units, total_packs
+        totals = self.items.aggregate(
+            units=Sum(F('pack_quantity') * Coalesce('units_per_pack', 'item__units_per_pack')),
+            packs=Sum('pack_quantity'),
+        )
+        return totals['units'] or 0, totals['packs'] or 0
 
     def calculate_total_weight(self):
-        total_weight = Decimal('0.00')
+        total_weight = _ZERO
         for item in self.items.all():
             total_weight += item.total_weight_kg
-        return total_weight.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return total_weight.quantize(_CENT, rounding=ROUND_HALF_UP)
 
     def calculate_total(self):
         subtotal = self.calculate_subtotal()
         if subtotal > 600:
             self.discount = Decimal('10.00')
         else:
-            self.discount = Decimal('0.00')
-        discount_amount = (subtotal * self.discount) / Decimal('100.00')
+            self.discount = _ZERO
+        discount_amount = (subtotal * self.discount) / _HUNDRED
         discounted_subtotal = subtotal - discount_amount
-        vat_amount = (discounted_subtotal * self.vat) / Decimal('100.00')
+        vat_amount = (discounted_subtotal * self.vat) / _HUNDRED
         total = discounted_subtotal + vat_amount
-        return total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return total.quantize(_CENT, rounding=ROUND_HALF_UP)
     
     def update_cart(self):
         self.save()
@@ -1174,7 +2011,8 @@ class Cart(models.Model):
         use_pallet_pricing = total_weight >= Decimal('750.00')
 
         with transaction.atomic():
-            for item in self.items.select_for_update():
+            # The manager outer-joins user_exclusive_price, which PostgreSQL cannot lock
+            for item in self.items.select_for_update(of=('self',)):
                 variant = item.item.product_variant
                 if not variant:
                     continue
@@ -1223,7 +2061,7 @@ class Cart(models.Model):
                     item.pricing_tier = new_pricing_tier
                     item.unit_type = new_unit_type
                     item.full_clean()
-                    item.save()
+                    item.save(skip_validation=True)
 
 def update_cart_pricing_tiers(sender, instance, **kwargs):
     """
@@ -1240,10 +2078,18 @@ def update_cart_pricing_tiers_on_delete(sender, instance, **kwargs):
     if instance.cart:
         instance.cart.update_pricing_tiers()
 
+@receiver(post_save, sender=Item)
+def sync_cart_item_units_per_pack(sender, instance, created, **kwargs):
+    if _loaded_value_changed(instance, 'units_per_pack', created):
+        CartItem.objects.filter(item=instance).update(units_per_pack=instance.units_per_pack)
+        instance._loaded_values['units_per_pack'] = instance.units_per_pack
+
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_user_cart(sender, instance, created, **kwargs):
     if created:
-        Cart.objects.get_or_create(user=instance)
+        # A single INSERT ... ON CONFLICT DO NOTHING on the user unique index. Set user_id, not
+        # user: assigning the user would cache this pk-less Cart as instance.cart
+        Cart.objects.bulk_create([Cart(user_id=instance.pk)], ignore_conflicts=True)
 
 
 class ShippingAddress(models.Model):
@@ -1282,22 +2128,6 @@ class BillingAddress(models.Model):
         
 logger = logging.getLogger(__name__)
 
-class HRFlowable(Flowable):
-    def __init__(self, width, thickness=1, color=colors.black):
-        super().__init__()
-        self.width = width
-        self.thickness = thickness
-        self.color = color
-
-    def wrap(self, availWidth, availHeight):
-        self.width = min(self.width, availWidth)
-        return (self.width, self.thickness)
-
-    def draw(self):
-        self.canv.setLineWidth(self.thickness)
-        self.canv.setStrokeColor(self.color)
-        self.canv.line(0, 0, self.width, 0)
-
 class Order(models.Model):
     STATUS_CHOICES = (
         ('PENDING', 'Pending'),
@@ -1313,11 +2143,14 @@ class Order(models.Model):
         ('FAILED', 'Failed'),
         ('REFUND', 'Refund'),
     )
+    STATUS_VALUES = frozenset(value for value, _ in STATUS_CHOICES)
+    PAYMENT_STATUS_VALUES = frozenset(value for value, _ in PAYMENT_STATUS_CHOICES)
     PAYMENT_METHOD_CHOICES = (
         ('manual_payment', 'Manual Payment'),
     )
 
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    # Indexed as the leading column of order_user_recent_idx
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False)
     shipping_address = models.ForeignKey('ShippingAddress', on_delete=models.SET_NULL, null=True)
     billing_address = models.ForeignKey('BillingAddress', on_delete=models.SET_NULL, null=True)
     shipping_cost = models.DecimalField(max_digits=10, decimal_places=2, default=0.00, editable=False)
@@ -1355,8 +2188,9 @@ class Order(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['created_at']),
+            # Order history is read newest first, per user in the API and overall in the admin
+            models.Index(fields=['user', '-created_at'], name='order_user_recent_idx'),
+            models.Index(fields=['-created_at'], name='order_recent_idx'),
         ]
         verbose_name = 'order'
         verbose_name_plural = 'orders'
@@ -1402,25 +2236,27 @@ class Order(models.Model):
     def calculate_subtotal(self):
         """Calculate the overall subtotal by summing the totals of all OrderItems after UserExclusivePrice discounts."""
         try:
-            total = Decimal('0.00')
-            for item in self.items.all():
-                item_subtotal = item.calculate_subtotal()
-                total += item_subtotal
+            total = _ZERO
+            items = list(self.items.all())
+            with preload_pricing_data(items):
+                for item in items:
+                    item_subtotal = item.calculate_subtotal()
+                    total += item_subtotal
             logger.info(f"Order {self.id} subtotal: {total}")
-            return total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            return total.quantize(_CENT, rounding=ROUND_HALF_UP)
         except Exception as e:
             logger.error(f"Error calculating subtotal for order {self.id}: {str(e)}")
-            return Decimal('0.00')
+            return _ZERO
 
     def calculate_original_subtotal(self):
         """Calculate the overall subtotal after UserExclusivePrice discounts (same as calculate_subtotal)."""
         try:
             total = self.calculate_subtotal()
             logger.info(f"Order {self.id} original subtotal: {total}")
-            return total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            return total.quantize(_CENT, rounding=ROUND_HALF_UP)
         except Exception as e:
             logger.error(f"Error calculating original subtotal for order {self.id}: {str(e)}")
-            return Decimal('0.00')
+            return _ZERO
 
     def calculate_total(self):
         """
@@ -1432,30 +2268,30 @@ class Order(models.Model):
         """
         try:
             subtotal = self.calculate_subtotal()  # After UserExclusivePrice discounts
-            discount_amount = (subtotal * self.discount) / Decimal('100.00')
+            discount_amount = (subtotal * self.discount) / _HUNDRED
             discounted_subtotal = subtotal - discount_amount
-            vat_amount = (discounted_subtotal * self.vat) / Decimal('100.00')
-            shipping_cost = Decimal(str(self.shipping_cost)).quantize(Decimal('0.01'))
-            total = (discounted_subtotal + vat_amount + shipping_cost).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            vat_amount = (discounted_subtotal * self.vat) / _HUNDRED
+            shipping_cost = Decimal(str(self.shipping_cost)).quantize(_CENT)
+            total = (discounted_subtotal + vat_amount + shipping_cost).quantize(_CENT, rounding=ROUND_HALF_UP)
             logger.info(f"Order {self.id} total: {total} (subtotal={subtotal}, discount={self.discount}%, vat={self.vat}%, shipping={shipping_cost})")
             return total
         except Exception as e:
             logger.error(f"Error calculating total for order {self.id}: {str(e)}")
-            return Decimal('0.00')
+            return _ZERO
 
     def calculate_total_weight(self):
         """Calculate the total weight of all OrderItems."""
         try:
-            total_weight = Decimal('0.00')
+            total_weight = _ZERO
             for item in self.items.all():
                 item_weight_kg = item.calculate_weight()
                 total_units = item.total_units
-                total_weight += item_weight_kg * Decimal(total_units)
+                total_weight += item_weight_kg * total_units
             logger.info(f"Order {self.id} total weight: {total_weight}")
-            return total_weight.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            return total_weight.quantize(_CENT, rounding=ROUND_HALF_UP)
         except Exception as e:
             logger.error(f"Error calculating total weight for order {self.id}: {str(e)}")
-            return Decimal('0.00')
+            return _ZERO
 
     def calculate_total_units_and_packs(self):
         """Calculate total units and packs across all OrderItems."""
@@ -1472,16 +2308,22 @@ class Order(models.Model):
             logger.error(f"Error calculating units and packs for order {self.id}: {str(e)}")
             return 0, 0
 
-    def update_order(self):
+    def update_order(self, save_discount=True):
         """Update order calculations."""
         try:
             self.calculate_total()
-            super().save(update_fields=['discount'])
+            if save_discount:
+                super().save(update_fields=['discount'])
             logger.info(f"Updated order {self.id} calculations")
         except Exception as e:
             logger.error(f"Error updating order {self.id}: {str(e)}")
 
     def generate_invoice_pdf(self):
+        # reportlab is only needed when rendering, keep it off the import path
+        from .pdf import (
+            A4, cm, colors, HexColor, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+            getSampleStyleSheet, ParagraphStyle, HRFlowable,
+        )
         try:
             buffer = BytesIO()
             doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm, topMargin=2*cm, bottomMargin=2*cm)
@@ -1545,7 +2387,7 @@ class Order(models.Model):
 
             # Updated to include Units column
             data = [['SKU', 'Item', 'Packs', 'Units', 'Unit Price', 'Subtotal', 'Total']]
-            original_subtotal = Decimal('0.00')
+            original_subtotal = _ZERO
             items_exist = self.items.exists()
             logger.info(f"Order {self.id} has items: {items_exist}")
             if items_exist:
@@ -1553,8 +2395,7 @@ class Order(models.Model):
                     try:
                         original_item_subtotal = item.calculate_original_subtotal()
                         item_subtotal = item.calculate_subtotal()
-                        pricing_data = PricingTierData.objects.filter(pricing_tier=item.pricing_tier, item=item.item).first()
-                        unit_price = pricing_data.price if pricing_data else Decimal('0.00')
+                        unit_price = PricingTierData.get_price(item.item_id, item.pricing_tier_id) or _ZERO
                         discount_percent = item.calculate_discount_percentage()
                         original_subtotal += item_subtotal
                         total_display = f"€{item_subtotal:.2f}"
@@ -1599,9 +2440,9 @@ class Order(models.Model):
             elements.append(Spacer(1, 0.5*cm))
 
             subtotal = self.calculate_subtotal()
-            discount_amount = (subtotal * self.discount) / Decimal('100.00')
+            discount_amount = (subtotal * self.discount) / _HUNDRED
             discounted_subtotal = subtotal - discount_amount
-            vat_amount = (discounted_subtotal * self.vat) / Decimal('100.00')
+            vat_amount = (discounted_subtotal * self.vat) / _HUNDRED
             totals_data = [
                 ['', 'Subtotal', f"€{subtotal:.2f}"],
                 ['', f'Coupon Discount ({self.discount:.2f}%)', f"€{discount_amount:.2f}"],
@@ -1641,6 +2482,11 @@ class Order(models.Model):
             return None
 
     def generate_delivery_note_pdf(self):
+        # reportlab is only needed when rendering, keep it off the import path
+        from .pdf import (
+            A4, cm, colors, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+            getSampleStyleSheet, ParagraphStyle, HRFlowable,
+        )
         try:
             buffer = BytesIO()
             doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm, topMargin=2*cm, bottomMargin=2*cm)
@@ -1750,6 +2596,11 @@ class Order(models.Model):
             return None
 
     def generate_paid_receipt_pdf(self):
+        # reportlab is only needed when rendering, keep it off the import path
+        from .pdf import (
+            A4, cm, colors, HexColor, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+            getSampleStyleSheet, ParagraphStyle, HRFlowable,
+        )
         try:
             buffer = BytesIO()
             doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm, topMargin=2*cm, bottomMargin=2*cm)
@@ -1811,15 +2662,14 @@ class Order(models.Model):
 
             # Updated to include Units column
             data = [['SKU', 'Item', 'Packs', 'Units', 'Unit Price', 'Subtotal', 'Total']]
-            original_subtotal = Decimal('0.00')
+            original_subtotal = _ZERO
             items_exist = self.items.exists()
             if items_exist:
                 for item in self.items.all():
                     try:
                         original_item_subtotal = item.calculate_original_subtotal()
                         item_subtotal = item.calculate_subtotal()
-                        pricing_data = PricingTierData.objects.filter(pricing_tier=item.pricing_tier, item=item.item).first()
-                        unit_price = pricing_data.price if pricing_data else Decimal('0.00')
+                        unit_price = PricingTierData.get_price(item.item_id, item.pricing_tier_id) or _ZERO
                         discount_percent = item.calculate_discount_percentage()
                         original_subtotal += item_subtotal
                         total_display = f"€{item_subtotal:.2f}"
@@ -1863,9 +2713,9 @@ class Order(models.Model):
             elements.append(Spacer(1, 0.5*cm))
 
             subtotal = self.calculate_subtotal()
-            discount_amount = (subtotal * self.discount) / Decimal('100.00')
+            discount_amount = (subtotal * self.discount) / _HUNDRED
             discounted_subtotal = subtotal - discount_amount
-            vat_amount = (discounted_subtotal * self.vat) / Decimal('100.00')
+            vat_amount = (discounted_subtotal * self.vat) / _HUNDRED
             totals_data = [
                 ['', 'Subtotal', f"€{subtotal:.2f}"],
                 ['', f'Coupon Discount ({self.discount:.2f}%)', f"€{discount_amount:.2f}"],
@@ -1899,6 +2749,11 @@ class Order(models.Model):
             return None
 
     def generate_refund_receipt_pdf(self):
+        # reportlab is only needed when rendering, keep it off the import path
+        from .pdf import (
+            A4, cm, colors, HexColor, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+            getSampleStyleSheet, ParagraphStyle, HRFlowable,
+        )
         try:
             buffer = BytesIO()
             doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm, topMargin=2*cm, bottomMargin=2*cm)
@@ -1960,15 +2815,14 @@ class Order(models.Model):
 
             # Updated to include Units column
             data = [['SKU', 'Item', 'Packs', 'Units', 'Unit Price', 'Subtotal', 'Total']]
-            original_subtotal = Decimal('0.00')
+            original_subtotal = _ZERO
             items_exist = self.items.exists()
             if items_exist:
                 for item in self.items.all():
                     try:
                         original_item_subtotal = item.calculate_original_subtotal()
                         item_subtotal = item.calculate_subtotal()
-                        pricing_data = PricingTierData.objects.filter(pricing_tier=item.pricing_tier, item=item.item).first()
-                        unit_price = pricing_data.price if pricing_data else Decimal('0.00')
+                        unit_price = PricingTierData.get_price(item.item_id, item.pricing_tier_id) or _ZERO
                         discount_percent = item.calculate_discount_percentage()
                         original_subtotal += item_subtotal
                         total_display = f"€{item_subtotal:.2f}"
@@ -2012,9 +2866,9 @@ class Order(models.Model):
             elements.append(Spacer(1, 0.5*cm))
 
             subtotal = self.calculate_subtotal()
-            discount_amount = (subtotal * self.discount) / Decimal('100.00')
+            discount_amount = (subtotal * self.discount) / _HUNDRED
             discounted_subtotal = subtotal - discount_amount
-            vat_amount = (discounted_subtotal * self.vat) / Decimal('100.00')
+            vat_amount = (discounted_subtotal * self.vat) / _HUNDRED
             totals_data = [
                 ['', 'Subtotal', f"€{subtotal:.2f}"],
                 ['', f'Coupon Discount ({self.discount:.2f}%)', f"€{discount_amount:.2f}"],
@@ -2131,14 +2985,47 @@ class Order(models.Model):
             raise
 
     def save(self, *args, **kwargs):
-        self.full_clean()
+        if not kwargs.pop('skip_validation', False):
+            self.full_clean()
+        adding = self._state.adding
         super().save(*args, **kwargs)
         update_fields = kwargs.get('update_fields', [])
-        if self.items.exists() and not any(field in update_fields for field in ['invoice', 'delivery_note', 'discount', 'paid_receipt', 'refund_receipt']):
-            self.update_order()
-            self.generate_and_save_pdfs()
-            if self.payment_verified or self.payment_status in ['COMPLETED', 'REFUND']:
-                self.generate_and_save_payment_receipts()
+        # A freshly inserted order has no lines yet
+        if not adding and self.items.exists() and not any(field in update_fields for field in ['invoice', 'delivery_note', 'discount', 'paid_receipt', 'refund_receipt']):
+            # Totals and every PDF price each line several times; read the prices once
+            with preload_pricing_data(self.items.all()):
+                # A full save has just written the discount
+                self.update_order(save_discount=bool(update_fields))
+                self.generate_and_save_pdfs()
+                if self.payment_verified or self.payment_status in ['COMPLETED', 'REFUND']:
+                    self.generate_and_save_payment_receipts()
+
+    @classmethod
+    def validate_stock(cls, lines):
+        """
+        Lock the tracked items of the given lines and check their combined units against stock.
+        Call inside a transaction; the lines' items get the stock read under the lock.
+        """
+        units = {}
+        for line in lines:
+            if line.item_id:
+                units[line.item_id] = units.get(line.item_id, 0) + line.total_units
+        locked = Item.raw_objects.select_for_update().filter(
+            pk__in=units, track_inventory=True
+        ).order_by('pk').only('pk', 'stock', 'sku')
+        stock = {}
+        errors = []
+        for item in locked:
+            stock[item.pk] = item.stock
+            if item.stock is None or units[item.pk] > item.stock:
+                errors.append(
+                    f"Insufficient stock for {item.sku}. Available: {item.stock or 0} units, Required: {units[item.pk]} units."
+                )
+        if errors:
+            raise ValidationError({'items': errors})
+        for line in lines:
+            if line.item_id in stock:
+                line.item.stock = stock[line.item_id]
 
     def update_order_items(self, new_item):
         """Update order with a new or existing item."""
@@ -2250,8 +3137,16 @@ def handle_payment_status_change(sender, instance, **kwargs):
     except Exception as e:
         logger.error(f"Error handling payment status change for order {instance.id}: {str(e)}")
 
+class OrderItemManager(models.Manager):
+    def get_queryset(self):
+        """
+        Joins the item, pricing tier and exclusive price read by clean(), totals and serializers.
+        """
+        return super().get_queryset().select_related('item', 'pricing_tier', 'user_exclusive_price')
+
 class OrderItem(models.Model):
-    order = models.ForeignKey('Order', on_delete=models.CASCADE, related_name='items')
+    # Indexed as the leading column of unique_together
+    order = models.ForeignKey('Order', on_delete=models.CASCADE, related_name='items', db_index=False)
     item = models.ForeignKey('Item', on_delete=models.PROTECT, related_name='order_items')
     pricing_tier = models.ForeignKey('PricingTier', on_delete=models.PROTECT, related_name='order_items')
     pack_quantity = models.PositiveIntegerField()
@@ -2272,12 +3167,10 @@ class OrderItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = OrderItemManager()
+    raw_objects = models.Manager()
+
     class Meta:
-        indexes = [
-            models.Index(fields=['order', 'item']),
-            models.Index(fields=['pricing_tier']),
-            models.Index(fields=['created_at']),
-        ]
         unique_together = ('order', 'item', 'pricing_tier', 'pack_quantity', 'unit_type')
         verbose_name = 'order item'
         verbose_name_plural = 'order items'
@@ -2286,42 +3179,36 @@ class OrderItem(models.Model):
         """Calculate the weight per unit."""
         try:
             if not self.item:
-                return Decimal('0.00')
-            weight = self.item.weight or Decimal('0.00')
+                return _ZERO
+            weight = self.item.weight or _ZERO
             weight_unit = self.item.weight_unit or 'kg'
             return self.convert_weight_to_kg(weight, weight_unit)
         except Exception as e:
             logger.error(f"Error calculating weight for order item {self.id}: {str(e)}")
-            return Decimal('0.00')
+            return _ZERO
 
     def calculate_discount_percentage(self):
         """Calculate the discount percentage from UserExclusivePrice."""
         try:
             if self.user_exclusive_price and hasattr(self.user_exclusive_price, 'discount_percentage'):
-                return self.user_exclusive_price.discount_percentage.quantize(Decimal('0.01'))
-            return Decimal('0.00')
+                return self.user_exclusive_price.discount_percentage.quantize(_CENT)
+            return _ZERO
         except Exception as e:
             logger.error(f"Error calculating discount percentage for order item {self.id}: {str(e)}")
-            return Decimal('0.00')
+            return _ZERO
 
     def convert_weight_to_kg(self, weight, weight_unit):
         """Convert weight to kilograms."""
         try:
             if weight is None or weight_unit is None:
-                return Decimal('0.00')
-            weight = Decimal(str(weight))
-            if weight_unit == 'lb':
-                return (weight * Decimal('0.453592')).quantize(Decimal('0.01'))
-            elif weight_unit == 'oz':
-                return (weight * Decimal('0.0283495')).quantize(Decimal('0.01'))
-            elif weight_unit == 'g':
-                return (weight * Decimal('0.001')).quantize(Decimal('0.01'))
-            elif weight_unit == 'kg':
-                return weight.quantize(Decimal('0.01'))
-            return Decimal('0.00')
+                return _ZERO
+            factor = _KG_PER_WEIGHT_UNIT.get(weight_unit)
+            if factor is None:
+                return _ZERO
+            return (Decimal(str(weight)) * factor).quantize(_CENT)
         except Exception as e:
             logger.error(f"Error converting weight for order item {self.id}: {str(e)}")
-            return Decimal('0.00')
+            return _ZERO
 
     @property
     def total_units(self):
@@ -2338,31 +3225,30 @@ class OrderItem(models.Model):
     def calculate_original_subtotal(self):
         """Calculate original subtotal, without UserExclusivePrice discounts."""
         try:
-            pricing_data = PricingTierData.objects.filter(
-                pricing_tier=self.pricing_tier, item=self.item
-            ).first()
-            if pricing_data and self.item:
+            price = PricingTierData.get_price(self.item_id, self.pricing_tier_id)
+            if price is not None and self.item:
                 units_per_pack = self.item.units_per_pack or 1
-                per_pack_price = pricing_data.price * Decimal(units_per_pack)
-                item_subtotal = per_pack_price * Decimal(self.pack_quantity)
-                return item_subtotal.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-            return Decimal('0.00')
+                per_pack_price = price * units_per_pack
+                item_subtotal = per_pack_price * self.pack_quantity
+                return item_subtotal.quantize(_CENT, rounding=ROUND_HALF_UP)
+            return _ZERO
         except Exception as e:
             logger.error(f"Error calculating original subtotal for order item {self.id}: {str(e)}")
-            return Decimal('0.00')
+            return _ZERO
 
     def calculate_subtotal(self):
         """Calculate subtotal, applying UserExclusivePrice discounts."""
         try:
             item_subtotal = self.calculate_original_subtotal()
-            if self.user_exclusive_price:
-                discount_percentage = self.user_exclusive_price.discount_percentage
-                discount = discount_percentage / Decimal('100.00')
-                item_subtotal = item_subtotal * (Decimal('1.00') - discount)
-            return item_subtotal.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            uep = self.user_exclusive_price
+            if uep is None or not uep.discount_percentage:
+                # Already quantized; nothing to discount
+                return item_subtotal
+            item_subtotal = item_subtotal * uep.price_multiplier
+            return item_subtotal.quantize(_CENT, rounding=ROUND_HALF_UP)
         except Exception as e:
             logger.error(f"Error calculating subtotal for order item {self.id}: {str(e)}")
-            return Decimal('0.00')
+            return _ZERO
 
     def clean(self):
         errors = {}
@@ -2374,7 +3260,7 @@ class OrderItem(models.Model):
             elif self.pack_quantity <= 0:
                 errors['pack_quantity'] = "Pack quantity must be a positive number."
             if self.item and self.pricing_tier:
-                if self.pricing_tier.product_variant != self.item.product_variant:
+                if self.pricing_tier.product_variant_id != self.item.product_variant_id:
                     errors['pricing_tier'] = "Pricing tier must belong to the same product variant as the item."
                 else:
                     units_per_pack = self.item.units_per_pack or 1
@@ -2388,9 +3274,15 @@ class OrderItem(models.Model):
                             f"Pack quantity {self.pack_quantity} exceeds the pricing tier range "
                             f"{self.pricing_tier.range_start}-{self.pricing_tier.range_end}."
                         )
-                    pricing_data = PricingTierData.objects.filter(pricing_tier=self.pricing_tier, item=self.item).first()
-                    if not pricing_data:
-                        errors['pricing_tier'] = "No pricing data found for this item and pricing tier."
+                    # A saved line only needs its price row re-checked when the item or tier changed since
+                    # it was loaded or last saved
+                    loaded = getattr(self, '_loaded_values', None)
+                    if not loaded or (loaded.get('item_id'), loaded.get('pricing_tier_id')) != (
+                        self.item_id, self.pricing_tier_id
+                    ):
+                        price = PricingTierData.get_price(self.item_id, self.pricing_tier_id)
+                        if price is None:
+                            errors['pricing_tier'] = "No pricing data found for this item and pricing tier."
             if self.item and self.item.track_inventory:
                 total_units = self.total_units
                 if self.item.stock is None or total_units > self.item.stock:
@@ -2398,9 +3290,9 @@ class OrderItem(models.Model):
                         f"Insufficient stock for {self.item.sku}. Available: {self.item.stock or 0} units, Required: {total_units} units."
                     )
             if self.user_exclusive_price:
-                if self.user_exclusive_price.item != self.item:
+                if self.user_exclusive_price.item_id != self.item_id:
                     errors['user_exclusive_price'] = "User exclusive price must correspond to the selected item."
-                elif self.user_exclusive_price.user != self.order.user:
+                elif self.user_exclusive_price.user_id != self.order.user_id:
                     errors['user_exclusive_price'] = "User exclusive price must correspond to the order's user."
         except Exception as e:
             logger.error(f"Error cleaning order item {self.id}: {str(e)}")
@@ -2408,8 +3300,15 @@ class OrderItem(models.Model):
         if errors:
             raise ValidationError(errors)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
     def save(self, *args, **kwargs):
         try:
+            skip_validation = kwargs.pop('skip_validation', False)
             if not self.item:
                 raise ValidationError({"item": "OrderItem cannot be saved without an item."})
             with transaction.atomic():
@@ -2422,8 +3321,9 @@ class OrderItem(models.Model):
                     existing_order_item.pricing_tier = self.pricing_tier
                     existing_order_item.user_exclusive_price = self.user_exclusive_price
                     existing_order_item.unit_type = self.unit_type
+                    # The caller validated this line, not the merged one
                     existing_order_item.full_clean()
-                    existing_order_item.save(*args, **kwargs)
+                    existing_order_item.save(*args, skip_validation=True, **kwargs)
                     try:
                         self.order.update_order()
                     except Exception as e:
@@ -2431,8 +3331,10 @@ class OrderItem(models.Model):
                     self.pk = existing_order_item.pk
                     return existing_order_item
                 else:
-                    self.full_clean()
+                    if not skip_validation:
+                        self.full_clean()
                     super().save(*args, **kwargs)
+                    _remember_saved_values(self, kwargs.get('update_fields'))
                     try:
                         self.order.update_order()
                     except Exception as e:
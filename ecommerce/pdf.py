@@ -0,0 +1,30 @@
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import cm
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.colors import HexColor
+from reportlab.platypus.flowables import Flowable
+
+# reportlab names used by the Order PDF builders, imported only when a PDF is rendered
+__all__ = [
+    'colors', 'A4', 'cm', 'SimpleDocTemplate', 'Paragraph', 'Spacer', 'Table', 'TableStyle',
+    'getSampleStyleSheet', 'ParagraphStyle', 'HexColor', 'HRFlowable',
+]
+
+
+class HRFlowable(Flowable):
+    def __init__(self, width, thickness=1, color=colors.black):
+        super().__init__()
+        self.width = width
+        self.thickness = thickness
+        self.color = color
+
+    def wrap(self, availWidth, availHeight):
+        self.width = min(self.width, availWidth)
+        return (self.width, self.thickness)
+
+    def draw(self):
+        self.canv.setLineWidth(self.thickness)
+        self.canv.setStrokeColor(self.color)
+        self.canv.line(0, 0, self.width, 0)
@@ -1,11 +1,13 @@
 from rest_framework import serializers
 from ecommerce.models import (
     Category, Product, ProductImage, ProductVariant, PricingTier, PricingTierData,
-    TableField, Item, ItemImage, ItemData, UserExclusivePrice, Cart, CartItem, Order, OrderItem, ShippingAddress, BillingAddress
+    TableField, Item, ItemImage, ItemData, UserExclusivePrice, Cart, CartItem, Order, OrderItem, ShippingAddress, BillingAddress,
+    preload_pricing_data
 )
 from decimal import Decimal, ROUND_HALF_UP
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import PermissionDenied, ValidationError as DjangoValidationError
 from django.db import transaction
+from django.db.models import Q
 import logging
 
 logger = logging.getLogger(__name__)
@@ -70,40 +72,44 @@ class PricingTierSerializer(serializers.ModelSerializer):
             show_units_per = product_variant.show_units_per
             if show_units_per == 'pack' and tier_type != 'pack':
                 raise serializers.ValidationError("Tier type must be 'pack' when show_units_per is 'Pack'.")
-            if show_units_per == 'both' and tier_type not in ['pack', 'pallet']:
+            if show_units_per == 'both' and tier_type not in PricingTier.TIER_TYPE_VALUES:
                 raise serializers.ValidationError("Tier type must be 'pack' or 'pallet' when show_units_per is 'Both'.")
 
         # Validate mandatory starting range and sequential ranges
         if product_variant:
             instance = self.instance
-            existing_tiers = PricingTier.objects.filter(
+            existing_tiers = PricingTier.raw_objects.filter(
                 product_variant=product_variant,
                 tier_type=tier_type
             )
             if instance:
                 existing_tiers = existing_tiers.exclude(id=instance.id)
-            existing_tiers = existing_tiers.order_by('range_start')
+
+            # Check for overlaps in SQL; only the first overlapping tier is fetched for the message
+            overlapping = existing_tiers.filter(Q(no_end_range=True) | Q(range_end__gte=range_start))
+            if not no_end_range:
+                overlapping = overlapping.filter(range_start__lte=range_end)
+            tier = overlapping.order_by('range_start').first()
+            if tier:
+                raise serializers.ValidationError(
+                    f"Range {range_start}-{'+' if no_end_range else range_end} overlaps with "
+                    f"existing range {tier.range_start}-{'+' if tier.no_end_range else tier.range_end} for {tier_type}."
+                )
+
+            # Only the range columns of the other tiers are needed for the sequence checks
+            existing_tiers = list(
+                existing_tiers.order_by('range_start').only(*PricingTier.RANGE_FIELDS)
+            )
 
             # Check if this is the first tier
             if not existing_tiers and range_start != 1:
                 raise serializers.ValidationError(f"The first {tier_type} tier must start from 1.")
 
-            # Check for overlaps and gaps
-            current_end = float('inf') if no_end_range else range_end
-            for tier in existing_tiers:
-                tier_end = float('inf') if tier.no_end_range else tier.range_end
-                if range_start <= tier_end and current_end >= tier.range_start:
-                    raise serializers.ValidationError(
-                        f"Range {range_start}-{'+' if no_end_range else range_end} overlaps with "
-                        f"existing range {tier.range_start}-{'+' if tier.no_end_range else tier.range_end} for {tier_type}."
-                    )
-
             # Check sequential ranges
             if existing_tiers:
-                first_tier = existing_tiers.first()
-                if first_tier.range_start != 1:
+                if existing_tiers[0].range_start != 1:
                     raise serializers.ValidationError(f"The first {tier_type} tier must start from 1.")
-                sorted_tiers = list(existing_tiers)
+                sorted_tiers = existing_tiers
                 if not no_end_range and range_end:
                     sorted_tiers.append(PricingTier(
                         tier_type=tier_type,
@@ -115,7 +121,6 @@ class PricingTierSerializer(serializers.ModelSerializer):
                 for i in range(len(sorted_tiers) - 1):
                     current = sorted_tiers[i]
                     next_tier = sorted_tiers[i + 1]
-                    current_end = float('inf') if current.no_end_range else current.range_end
                     if not current.no_end_range and next_tier.range_start != current.range_end + 1:
                         raise serializers.ValidationError(
                             f"Range {range_start}-{'+' if no_end_range else range_end} creates a gap or is not sequential "
@@ -140,7 +145,8 @@ class ProductVariantSerializer(serializers.ModelSerializer):
 
         # Validate pricing tiers if instance exists
         if self.instance and self.instance.pk:
-            pricing_tiers = self.instance.pricing_tiers.all()
+            # Only the range columns are read; the variant is self.instance
+            pricing_tiers = PricingTier.raw_objects.filter(product_variant=self.instance).only(*PricingTier.RANGE_FIELDS)
             pack_tiers = sorted([tier for tier in pricing_tiers if tier.tier_type == 'pack'], key=lambda x: x.range_start)
             pallet_tiers = [tier for tier in pricing_tiers if tier.tier_type == 'pallet']
 
@@ -195,7 +201,7 @@ class TableFieldSerializer(serializers.ModelSerializer):
         return value
 
     def validate_field_type(self, value):
-        if value not in [choice[0] for choice in TableField.FIELD_TYPES]:
+        if value not in TableField.FIELD_TYPE_VALUES:
             raise serializers.ValidationError(f"Field type must be one of: {', '.join([choice[0] for choice in TableField.FIELD_TYPES])}.")
         return value
 
@@ -228,21 +234,9 @@ class ItemDataSerializer(serializers.ModelSerializer):
         if value_image == '':
             value_image = None
 
-        if field.field_type == 'text':
-            if value_text is None:
-                raise serializers.ValidationError(f"Provide a value for the text field '{field.name}'.")
-            if value_number is not None or value_image:
-                raise serializers.ValidationError(f"Field '{field.name}' only accepts text values.")
-        elif field.field_type == 'number':
-            if value_number is None:
-                raise serializers.ValidationError(f"Provide a number for the field '{field.name}'.")
-            if value_text is not None or value_image:
-                raise serializers.ValidationError(f"Field '{field.name}' only accepts number values.")
-        elif field.field_type == 'image':
-            if not value_image:
-                raise serializers.ValidationError(f"Upload an image for the field '{field.name}'.")
-            if value_text is not None or value_number is not None:
-                raise serializers.ValidationError(f"Field '{field.name}' only accepts image values.")
+        errors = ItemData.validate_value(field.field_type, field.name, value_text, value_number, value_image)
+        if errors:
+            raise serializers.ValidationError(next(iter(errors.values())))
 
         data['value_text'] = value_text
         data['value_number'] = value_number
@@ -263,6 +257,16 @@ class ItemSerializer(serializers.ModelSerializer):
             'units_per_pack'
         ]
 
+    def validate_sku(self, value):
+        # SKUs are stored upper-cased (Item.clean); the field's UniqueValidator only saw the raw input
+        value = value.strip().upper()
+        duplicates = Item.raw_objects.filter(sku=value)
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError("item with this sku already exists.")
+        return value
+
     def validate(self, data):
         is_physical_product = data.get('is_physical_product', False)
         weight = data.get('weight')
@@ -287,12 +291,7 @@ class ItemSerializer(serializers.ModelSerializer):
         if units_per_pack is None or units_per_pack <= 0:
             raise serializers.ValidationError("Units per pack must be provided and greater than 0.")
 
-        required_categories = ['box', 'boxes', 'postal', 'postals', 'bag', 'bags']
-        category_name = ''
-        if product_variant and product_variant.product and product_variant.product.category:
-            category_name = product_variant.product.category.name.lower()
-
-        if category_name in required_categories:
+        if product_variant and product_variant.requires_dimensions:
             if height is None or height <= 0:
                 raise serializers.ValidationError("Height must be provided and greater than 0 for items in categories: box, boxes, postal, postals, bag, bags.")
             if width is None or width <= 0:
@@ -334,6 +333,14 @@ class UserExclusivePriceSerializer(serializers.ModelSerializer):
         model = UserExclusivePrice
         fields = ['id', 'user', 'item', 'discount_percentage', 'created_at']
 
+    def validate_discount_percentage(self, value):
+        # Checked against the model's uep_discount_range constraint so the API answers with a 400
+        try:
+            UserExclusivePrice(discount_percentage=value).validate_constraints(exclude={'user', 'item'})
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.messages)
+        return value
+
 class CartItemSerializer(serializers.ModelSerializer):
     cart = serializers.PrimaryKeyRelatedField(queryset=Cart.objects.all())
     item = serializers.PrimaryKeyRelatedField(queryset=Item.objects.all(), required=True)
@@ -366,12 +373,12 @@ class CartItemSerializer(serializers.ModelSerializer):
 
         if instance.pack_quantity <= 0:
             raise serializers.ValidationError("Pack quantity must be positive.")
-        if instance.pricing_tier and instance.item and instance.pricing_tier.product_variant != instance.item.product_variant:
+        if instance.pricing_tier and instance.item and instance.pricing_tier.product_variant_id != instance.item.product_variant_id:
             raise serializers.ValidationError("Pricing tier must belong to the same product variant as the item.")
         if instance.user_exclusive_price:
-            if instance.item and instance.user_exclusive_price.item != instance.item:
+            if instance.item and instance.user_exclusive_price.item_id != instance.item_id:
                 raise serializers.ValidationError("User exclusive price must correspond to the selected item.")
-            if instance.cart and instance.user_exclusive_price.user != instance.cart.user:
+            if instance.cart and instance.user_exclusive_price.user_id != instance.cart.user_id:
                 raise serializers.ValidationError("User exclusive price must correspond to the cart's user.")
 
         if 'user_exclusive_price' in data and data['user_exclusive_price']:
@@ -402,7 +409,7 @@ class CartItemSerializer(serializers.ModelSerializer):
             existing_cart_item.pricing_tier = pricing_tier
             existing_cart_item.user_exclusive_price = user_exclusive_price
             existing_cart_item.full_clean()
-            existing_cart_item.save()
+            existing_cart_item.save(skip_validation=True)
             existing_cart_item.cart.update_pricing_tiers()
             return existing_cart_item
         
@@ -415,7 +422,7 @@ class CartItemSerializer(serializers.ModelSerializer):
             user_exclusive_price=user_exclusive_price
         )
         cart_item.full_clean()
-        cart_item.save()
+        cart_item.save(skip_validation=True)
         cart_item.cart.update_pricing_tiers()
         return cart_item
 
@@ -425,7 +432,7 @@ class CartItemSerializer(serializers.ModelSerializer):
         instance.user_exclusive_price = validated_data.get('user_exclusive_price', instance.user_exclusive_price)
         instance.unit_type = validated_data.get('unit_type', instance.unit_type)
         instance.full_clean()
-        instance.save()
+        instance.save(skip_validation=True)
         instance.cart.update_pricing_tiers()
         return instance
 
@@ -441,33 +448,32 @@ class CartItemDetailSerializer(serializers.ModelSerializer):
         return obj.user_exclusive_price.discount_percentage if obj.user_exclusive_price else Decimal('0.00')
 
     def get_price_per_unit(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        return pricing_data.price if pricing_data else Decimal('0.00')
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        return price if price is not None else Decimal('0.00')
 
     def get_price_per_pack(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
-            return pricing_data.price * Decimal(obj.item.units_per_pack or 1)
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        if price is not None and obj.item:
+            return price * (obj.item.units_per_pack or 1)
         return Decimal('0.00')
 
     def get_subtotal(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        if price is not None and obj.item:
             units_per_pack = obj.item.units_per_pack or 1
-            per_pack_price = pricing_data.price * Decimal(units_per_pack)
-            return (per_pack_price * Decimal(obj.pack_quantity)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            per_pack_price = price * units_per_pack
+            return (per_pack_price * obj.pack_quantity).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
         return Decimal('0.00')
 
     def get_total(self, obj):
         subtotal = self.get_subtotal(obj)
-        discount_percentage = obj.user_exclusive_price.discount_percentage if obj.user_exclusive_price else Decimal('0.00')
-        discount = discount_percentage / Decimal('100.00')
-        return (subtotal * (Decimal('1.00') - discount)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        price_multiplier = obj.user_exclusive_price.price_multiplier if obj.user_exclusive_price else Decimal('1.00')
+        return (subtotal * price_multiplier).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
     def get_weight(self, obj):
         item_weight_kg = obj.convert_weight_to_kg(obj.item.weight, obj.item.weight_unit)
         total_units = obj.total_units
-        return (item_weight_kg * Decimal(total_units)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return (item_weight_kg * total_units).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
@@ -521,7 +527,8 @@ class CartSerializer(serializers.ModelSerializer):
                 'total_packs': 0,
             }
 
-        representation = super().to_representation(instance)
+        with preload_pricing_data(instance.items.all()):
+            representation = super().to_representation(instance)
         representation.update({
             'subtotal': str(self.get_subtotal(instance)),
             'total': str(self.get_total(instance)),
@@ -554,7 +561,7 @@ class CartSerializer(serializers.ModelSerializer):
                         existing_item.user_exclusive_price
                     )
                     existing_item.full_clean()
-                    existing_item.save()
+                    existing_item.save(skip_validation=True)
                 else:
                     CartItem.objects.create(cart=instance, **item_data)
             
@@ -588,44 +595,43 @@ class OrderItemSerializer(serializers.ModelSerializer):
 
         if instance.pack_quantity <= 0:
             raise serializers.ValidationError("Pack quantity must be positive.")
-        if instance.pricing_tier and instance.item and instance.pricing_tier.product_variant != instance.item.product_variant:
+        if instance.pricing_tier and instance.item and instance.pricing_tier.product_variant_id != instance.item.product_variant_id:
             raise serializers.ValidationError("Pricing tier must belong to the same product variant as the item.")
         if instance.user_exclusive_price:
-            if instance.item and instance.user_exclusive_price.item != instance.item:
+            if instance.item and instance.user_exclusive_price.item_id != instance.item_id:
                 raise serializers.ValidationError("User exclusive price must correspond to the selected item.")
-            if instance.order and instance.user_exclusive_price.user != instance.order.user:
+            if instance.order and instance.user_exclusive_price.user_id != instance.order.user_id:
                 raise serializers.ValidationError("User exclusive price must correspond to the order's user.")
 
         return data
 
     def get_price_per_unit(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        return pricing_data.price if pricing_data else Decimal('0.00')
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        return price if price is not None else Decimal('0.00')
 
     def get_price_per_pack(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
-            return pricing_data.price * Decimal(obj.item.units_per_pack or 1)
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        if price is not None and obj.item:
+            return price * (obj.item.units_per_pack or 1)
         return Decimal('0.00')
 
     def get_subtotal(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        if price is not None and obj.item:
             units_per_pack = obj.item.units_per_pack or 1
-            per_pack_price = pricing_data.price * Decimal(units_per_pack)
-            return (per_pack_price * Decimal(obj.pack_quantity)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            per_pack_price = price * units_per_pack
+            return (per_pack_price * obj.pack_quantity).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
         return Decimal('0.00')
 
     def get_total(self, obj):
         subtotal = self.get_subtotal(obj)
-        discount_percentage = obj.user_exclusive_price.discount_percentage if obj.user_exclusive_price else Decimal('0.00')
-        discount = discount_percentage / Decimal('100.00')
-        return (subtotal * (Decimal('1.00') - discount)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        price_multiplier = obj.user_exclusive_price.price_multiplier if obj.user_exclusive_price else Decimal('1.00')
+        return (subtotal * price_multiplier).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
     def get_weight(self, obj):
         item_weight_kg = obj.convert_weight_to_kg(obj.item.weight, obj.item.weight_unit)
         total_units = obj.total_units
-        return (item_weight_kg * Decimal(total_units)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return (item_weight_kg * total_units).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
@@ -655,7 +661,7 @@ class OrderItemSerializer(serializers.ModelSerializer):
             user_exclusive_price=user_exclusive_price
         )
         order_item.full_clean()
-        order_item.save()
+        order_item.save(skip_validation=True)
         return order_item
 
     def update(self, instance, validated_data):
@@ -663,7 +669,7 @@ class OrderItemSerializer(serializers.ModelSerializer):
         instance.pricing_tier = validated_data.get('pricing_tier', instance.pricing_tier)
         instance.user_exclusive_price = validated_data.get('user_exclusive_price', instance.user_exclusive_price)
         instance.full_clean()
-        instance.save()
+        instance.save(skip_validation=True)
         return instance
 
 class ShippingAddressSerializer(serializers.ModelSerializer):
@@ -691,33 +697,32 @@ class OrderItemDetailSerializer(serializers.ModelSerializer):
         return ItemSerializer(obj.item, context=self.context).data
 
     def get_price_per_unit(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        return pricing_data.price if pricing_data else Decimal('0.00')
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        return price if price is not None else Decimal('0.00')
 
     def get_price_per_pack(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
-            return pricing_data.price * Decimal(obj.item.units_per_pack or 1)
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        if price is not None and obj.item:
+            return price * (obj.item.units_per_pack or 1)
         return Decimal('0.00')
 
     def get_subtotal(self, obj):
-        pricing_data = PricingTierData.objects.filter(pricing_tier=obj.pricing_tier, item=obj.item).first()
-        if pricing_data and obj.item:
+        price = PricingTierData.get_price(obj.item_id, obj.pricing_tier_id)
+        if price is not None and obj.item:
             units_per_pack = obj.item.units_per_pack or 1
-            per_pack_price = pricing_data.price * Decimal(units_per_pack)
-            return (per_pack_price * Decimal(obj.pack_quantity)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            per_pack_price = price * units_per_pack
+            return (per_pack_price * obj.pack_quantity).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
         return Decimal('0.00')
 
     def get_total(self, obj):
         subtotal = self.get_subtotal(obj)
-        discount_percentage = obj.user_exclusive_price.discount_percentage if obj.user_exclusive_price else Decimal('0.00')
-        discount = discount_percentage / Decimal('100.00')
-        return (subtotal * (Decimal('1.00') - discount)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        price_multiplier = obj.user_exclusive_price.price_multiplier if obj.user_exclusive_price else Decimal('1.00')
+        return (subtotal * price_multiplier).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
     def get_weight(self, obj):
         item_weight_kg = obj.convert_weight_to_kg(obj.item.weight, obj.item.weight_unit)
         total_units = obj.total_units
-        return (item_weight_kg * Decimal(total_units)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return (item_weight_kg * total_units).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
@@ -776,7 +781,7 @@ class OrderSerializer(serializers.ModelSerializer):
         normalized = value.upper() if value else value
         if normalized in status_map:
             normalized = status_map[normalized]
-        if normalized not in dict(Order.STATUS_CHOICES):
+        if normalized not in Order.STATUS_VALUES:
             raise serializers.ValidationError(f'"{value}" is not a valid choice.')
         return normalized
 
@@ -790,7 +795,7 @@ class OrderSerializer(serializers.ModelSerializer):
         normalized = value.upper() if value else value
         if normalized in payment_status_map:
             normalized = payment_status_map[normalized]
-        if normalized not in dict(Order.PAYMENT_STATUS_CHOICES):
+        if normalized not in Order.PAYMENT_STATUS_VALUES:
             raise serializers.ValidationError(f'"{value}" is not a valid choice.')
         return normalized
 
@@ -841,30 +846,35 @@ class OrderSerializer(serializers.ModelSerializer):
 
             from .models import Cart, CartItem
             cart = Cart.objects.filter(user=user).first()
-            if cart and cart.items.exists():
-                for cart_item in cart.items.all():
-                    if cart_item.item and cart_item.pricing_tier and cart_item.pack_quantity:
-                        user_exclusive_price = cart_item.user_exclusive_price  # Use only if exists
-                        OrderItem.objects.create(
-                            order=order,
-                            item=cart_item.item,
-                            pricing_tier=cart_item.pricing_tier,
-                            pack_quantity=cart_item.pack_quantity,
-                            unit_type=cart_item.unit_type,
-                            user_exclusive_price=user_exclusive_price
-                        )
-                        logger.info(f"Created OrderItem for order {order.id}, item {cart_item.item.id}")
-                    else:
-                        logger.warning(f"Skipping invalid cart item for order {order.id}: {cart_item}")
-                cart.items.all().delete()
-                logger.info(f"Cleared cart for user {user.id}")
-            else:
-                logger.warning(f"No valid cart items found for user {user.id} during order {order.id} creation")
+            cart_items = list(cart.items.all()) if cart else []
+            # One locked stock read for the whole cart instead of an unlocked read per new line
+            Order.validate_stock(cart_items)
+            # Each new line's clean(), the order totals and the PDFs price the same (item, tier) pairs
+            with preload_pricing_data(cart_items):
+                if cart_items:
+                    for cart_item in cart_items:
+                        if cart_item.item and cart_item.pricing_tier and cart_item.pack_quantity:
+                            user_exclusive_price = cart_item.user_exclusive_price  # Use only if exists
+                            OrderItem.objects.create(
+                                order=order,
+                                item=cart_item.item,
+                                pricing_tier=cart_item.pricing_tier,
+                                pack_quantity=cart_item.pack_quantity,
+                                unit_type=cart_item.unit_type,
+                                user_exclusive_price=user_exclusive_price
+                            )
+                            logger.info(f"Created OrderItem for order {order.id}, item {cart_item.item.id}")
+                        else:
+                            logger.warning(f"Skipping invalid cart item for order {order.id}: {cart_item}")
+                    cart.items.all().delete()
+                    logger.info(f"Cleared cart for user {user.id}")
+                else:
+                    logger.warning(f"No valid cart items found for user {user.id} during order {order.id} creation")
 
-            order.calculate_total()
-            order.generate_and_save_pdfs()
-            if order.payment_verified or order.payment_status in ['COMPLETED', 'REFUND']:
-                order.generate_and_save_payment_receipts()
+                order.calculate_total()
+                order.generate_and_save_pdfs()
+                if order.payment_verified or order.payment_status in ['COMPLETED', 'REFUND']:
+                    order.generate_and_save_payment_receipts()
             logger.info(f"PDFs and receipts generated for order {order.id}")
 
             return order
@@ -930,7 +940,8 @@ class OrderSerializer(serializers.ModelSerializer):
                 'total_packs': 0,
             }
 
-        representation = super().to_representation(instance)
+        with preload_pricing_data(instance.items.all()):
+            representation = super().to_representation(instance)
         representation.update({
             'shipping_cost': str(instance.shipping_cost),
             'subtotal': str(self.get_subtotal(instance)),
@@ -1,3 +1,303 @@
-from django.test import TestCase
+from decimal import Decimal, ROUND_HALF_UP
 
-# Create your tests here.
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.contrib.auth import get_user_model
+from django.test import TestCase, skipUnlessDBFeature
+
+from .models import (
+    Category, Product, ProductVariant, PricingTier, PricingTierData, TableField, Item, ItemData, UserExclusivePrice,
+    CartItem, Order, unique_slugs,
+)
+
+
+def create_item(product_variant, sku, **kwargs):
+    fields = dict(
+        is_physical_product=True, weight=Decimal('2'), weight_unit='kg', title=sku,
+        height=Decimal('10'), width=Decimal('5'), length=Decimal('3'), measurement_unit='CM',
+    )
+    fields.update(kwargs)
+    return Item.objects.create(product_variant=product_variant, sku=sku, **fields)
+
+
+class PricingTierBulkImportTests(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name='Boxes')
+        product = Product.objects.create(category=category, name='Box', description='Box')
+        self.variant = ProductVariant.objects.create(product=product, name='Small', show_units_per='pack')
+        PricingTier.objects.create(product_variant=self.variant, tier_type='pack', range_start=1, range_end=10)
+
+    def test_gap_after_existing_tier_is_rejected_by_row(self):
+        with self.assertRaises(ValidationError) as raised:
+            PricingTier.bulk_import([
+                PricingTier(product_variant=self.variant, tier_type='pack', range_start=12, range_end=20),
+            ])
+        errors = raised.exception.message_dict
+        self.assertEqual(list(errors), ['row 0'])
+        self.assertIn("creates a gap or is not sequential", errors['row 0'][0])
+        self.assertEqual(PricingTier.objects.filter(product_variant=self.variant).count(), 1)
+
+    def test_overlap_within_batch_rejects_the_whole_batch(self):
+        with self.assertRaises(ValidationError) as raised:
+            PricingTier.bulk_import([
+                PricingTier(product_variant=self.variant, tier_type='pack', range_start=11, range_end=20),
+                PricingTier(product_variant=self.variant, tier_type='pack', range_start=15, no_end_range=True),
+            ])
+        errors = raised.exception.message_dict
+        self.assertEqual(set(errors), {'row 0', 'row 1'})
+        self.assertIn("overlaps with", errors['row 1'][0])
+        self.assertEqual(PricingTier.objects.filter(product_variant=self.variant).count(), 1)
+
+    def test_sequential_batch_is_created_and_activates_variant(self):
+        created = PricingTier.bulk_import([
+            PricingTier(product_variant=self.variant, tier_type='pack', range_start=21, no_end_range=True),
+            PricingTier(product_variant=self.variant, tier_type='pack', range_start=11, range_end=20),
+        ])
+        self.assertEqual(len(created), 2)
+        self.assertEqual(ProductVariant.objects.get(pk=self.variant.pk).status, 'active')
+
+
+class OrderValidateStockTests(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name='Boxes')
+        product = Product.objects.create(category=category, name='Box', description='Box')
+        variant = ProductVariant.objects.create(product=product, name='Small', show_units_per='pack')
+        self.item = create_item(variant, 'BOX-1', track_inventory=True, stock=60, units_per_pack=6)
+        self.untracked = create_item(variant, 'BOX-2', units_per_pack=6)
+
+    def test_lines_within_stock_pass_and_read_locked_stock(self):
+        lines = [CartItem(item=self.item, pack_quantity=4), CartItem(item=self.item, pack_quantity=6)]
+        Item.raw_objects.filter(pk=self.item.pk).update(stock=72)
+        Order.validate_stock(lines)
+        self.assertEqual(lines[0].item.stock, 72)
+
+    def test_combined_lines_over_stock_raise(self):
+        lines = [CartItem(item=self.item, pack_quantity=6), CartItem(item=self.item, pack_quantity=5)]
+        with self.assertRaises(ValidationError) as raised:
+            Order.validate_stock(lines)
+        self.assertEqual(
+            raised.exception.message_dict['items'],
+            ["Insufficient stock for BOX-1. Available: 60 units, Required: 66 units."],
+        )
+
+    def test_untracked_items_are_not_checked(self):
+        Order.validate_stock([CartItem(item=self.untracked, pack_quantity=1000)])
+
+
+class UniqueSlugTests(TestCase):
+    def test_collisions_continue_past_the_highest_suffix(self):
+        Category.objects.create(name='Foo Bar')
+        Category.objects.create(name='Other', slug='foo-bar-10')
+        category = Category.objects.create(name='Foo Bar!')
+        self.assertEqual(category.slug, 'foo-bar-11')
+
+    def test_repeated_bases_in_one_call_get_distinct_slugs(self):
+        Category.objects.create(name='Foo Bar')
+        slugs = unique_slugs(Category.objects.all(), ['foo-bar', 'foo-bar', 'new', 'new'], reserved={'new-1'})
+        self.assertEqual(slugs, ['foo-bar-1', 'foo-bar-2', 'new', 'new-2'])
+
+    def test_bulk_import_numbers_blank_slugs_around_explicit_ones(self):
+        categories = Category.bulk_import([
+            Category(name='Zed'), Category(name='zed!'), Category(name='Manual', slug='zed-1'),
+        ])
+        self.assertEqual([category.slug for category in categories], ['zed', 'zed-2', 'zed-1'])
+
+
+class ItemSkuTests(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name='Boxes')
+        product = Product.objects.create(category=category, name='Box', description='Box')
+        self.variant = ProductVariant.objects.create(product=product, name='Small', show_units_per='pack')
+
+    def test_saving_legacy_lower_case_sku_checks_the_upper_cased_value(self):
+        create_item(self.variant, 'ABC')
+        legacy = create_item(self.variant, 'OTHER')
+        Item.raw_objects.filter(pk=legacy.pk).update(sku='abc')
+        legacy = Item.objects.get(pk=legacy.pk)
+        with self.assertRaises(ValidationError) as raised:
+            legacy.save()
+        self.assertIn('sku', raised.exception.message_dict)
+
+    def test_sku_filter_finds_upper_cased_and_legacy_rows(self):
+        create_item(self.variant, 'ABC')
+        legacy = create_item(self.variant, 'OTHER')
+        Item.raw_objects.filter(pk=legacy.pk).update(sku='Mixed-1')
+        self.assertContains(self.client.get('/api/ecommerce/items/', {'sku': ' abc '}), '"ABC"')
+        self.assertContains(self.client.get('/api/ecommerce/items/', {'sku': 'Mixed-1'}), '"Mixed-1"')
+
+
+class PricingTierDataBulkUpsertTests(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name='Boxes')
+        product = Product.objects.create(category=category, name='Box', description='Box')
+        self.variant = ProductVariant.objects.create(product=product, name='Small', show_units_per='pack')
+        self.first_tier = PricingTier.objects.create(
+            product_variant=self.variant, tier_type='pack', range_start=1, range_end=10
+        )
+        self.last_tier = PricingTier.objects.create(
+            product_variant=self.variant, tier_type='pack', range_start=11, no_end_range=True
+        )
+        self.item = create_item(self.variant, 'BOX-1')
+        other = ProductVariant.objects.create(product=product, name='Large', show_units_per='pack')
+        self.other_tier = PricingTier.objects.create(product_variant=other, tier_type='pack', range_start=1, no_end_range=True)
+
+    # ON CONFLICT needs ptd_item_tier_unique, a covering constraint SQLite does not create
+    @skipUnlessDBFeature('supports_covering_indexes')
+    def test_second_upsert_updates_the_existing_row(self):
+        PricingTierData.bulk_upsert([PricingTierData(item=self.item, pricing_tier=self.first_tier, price=Decimal('1.50'))])
+        PricingTierData.bulk_upsert([PricingTierData(item=self.item, pricing_tier=self.first_tier, price=Decimal('1.25'))])
+        prices = PricingTierData.objects.filter(item=self.item).values_list('price', flat=True)
+        self.assertEqual(list(prices), [Decimal('1.25')])
+
+    @skipUnlessDBFeature('supports_covering_indexes')
+    def test_item_turns_active_once_every_tier_is_priced(self):
+        self.assertEqual(self.item.status, 'draft')
+        PricingTierData.bulk_upsert([PricingTierData(item=self.item, pricing_tier=self.first_tier, price=Decimal('1.50'))])
+        self.assertEqual(Item.objects.get(pk=self.item.pk).status, 'draft')
+        PricingTierData.bulk_upsert([PricingTierData(item=self.item, pricing_tier=self.last_tier, price=Decimal('1.20'))])
+        self.assertEqual(Item.objects.get(pk=self.item.pk).status, 'active')
+
+    def test_invalid_rows_are_reported_by_row(self):
+        with self.assertRaises(ValidationError) as raised:
+            PricingTierData.bulk_upsert([
+                PricingTierData(item=self.item, pricing_tier=self.first_tier, price=Decimal('1.50')),
+                PricingTierData(item=self.item, pricing_tier=self.other_tier, price=Decimal('1.50')),
+                PricingTierData(item=self.item, pricing_tier=self.last_tier, price=Decimal('0')),
+                PricingTierData(item=self.item, pricing_tier=self.last_tier, price=Decimal('12345678901.00')),
+            ])
+        errors = raised.exception.message_dict
+        self.assertEqual(set(errors), {'row 1', 'row 2', 'row 3'})
+        self.assertEqual(errors['row 1'], ["Pricing tier must belong to the same product variant as the item."])
+        self.assertEqual(errors['row 2'], ["Price per unit must be a positive number."])
+        self.assertIn("digits", errors['row 3'][0])
+        self.assertFalse(PricingTierData.objects.filter(item=self.item).exists())
+
+
+class ItemConstraintTests(TestCase):
+    """
+    The item_* check constraints guard writes that skip full_clean(), such as update() and bulk_create.
+    """
+    def setUp(self):
+        category = Category.objects.create(name='Boxes')
+        product = Product.objects.create(category=category, name='Box', description='Box')
+        variant = ProductVariant.objects.create(product=product, name='Small', show_units_per='pack')
+        self.item = create_item(variant, 'BOX-1', track_inventory=True, stock=60, units_per_pack=6)
+        self.items = Item.raw_objects.filter(pk=self.item.pk)
+
+    def assertUpdateRejected(self, **values):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.items.update(**values)
+
+    def test_physical_consistency(self):
+        self.items.update(weight=Decimal('3'), weight_unit='g')
+        self.items.update(is_physical_product=False, weight=None, weight_unit=None)
+        self.assertUpdateRejected(weight=Decimal('3'))
+        self.assertUpdateRejected(is_physical_product=True)
+        self.assertUpdateRejected(is_physical_product=True, weight=Decimal('0'), weight_unit='kg')
+
+    def test_inventory_consistency(self):
+        self.items.update(stock=0)
+        self.items.update(track_inventory=False, stock=None, title='')
+        self.assertUpdateRejected(stock=6)
+        self.items.update(track_inventory=True, stock=6, title='Box')
+        self.assertUpdateRejected(stock=None)
+        self.assertUpdateRejected(stock=-6)
+        # The title clause binds to the tracked branch only
+        self.assertUpdateRejected(title='')
+        self.assertUpdateRejected(title=None)
+
+    def test_stock_whole_packs(self):
+        self.items.update(stock=66)
+        self.assertUpdateRejected(stock=61)
+        self.assertUpdateRejected(units_per_pack=7)
+        # Untracked items have no stock to check
+        self.items.update(track_inventory=False, stock=None, units_per_pack=7)
+
+
+class DenormalizedCopyTests(TestCase):
+    """
+    Copies of related values that post_save receivers keep in sync when the source changes.
+    """
+    def setUp(self):
+        self.boxes = Category.objects.create(name='Boxes')
+        self.tape = Category.objects.create(name='Tape')
+        self.product = Product.objects.create(category=self.boxes, name='Box', description='Box')
+        self.variant = ProductVariant.objects.create(product=self.product, name='Small', show_units_per='pack')
+        self.item = create_item(self.variant, 'BOX-1')
+
+    def test_item_follows_a_variant_moved_to_another_product(self):
+        other = Product.objects.create(category=self.tape, name='Tape', description='Tape')
+        self.variant.product = other
+        self.variant.save()
+        item = Item.raw_objects.get(pk=self.item.pk)
+        self.assertEqual((item.product_id, item.category_id), (other.pk, self.tape.pk))
+
+    def test_item_follows_a_product_moved_to_another_category(self):
+        product = Product.objects.get(pk=self.product.pk)
+        product.category = self.tape
+        product.save()
+        self.assertEqual(Item.raw_objects.get(pk=self.item.pk).category_id, self.tape.pk)
+
+    def test_item_data_follows_an_item_moved_to_another_variant(self):
+        field = TableField.objects.create(product_variant=self.variant, name='Colour', field_type='text')
+        entry = ItemData.objects.create(item=self.item, field=field, value_text='Red')
+        other = ProductVariant.objects.create(product=self.product, name='Large', show_units_per='pack')
+        self.item.product_variant = other
+        self.item.save()
+        self.assertEqual(ItemData.raw_objects.get(pk=entry.pk).product_variant_id, other.pk)
+
+    def test_variant_requires_dimensions_follows_its_category(self):
+        self.assertTrue(ProductVariant.raw_objects.get(pk=self.variant.pk).requires_dimensions)
+        product = Product.objects.get(pk=self.product.pk)
+        product.category = self.tape
+        product.save()
+        self.assertFalse(ProductVariant.raw_objects.get(pk=self.variant.pk).requires_dimensions)
+        self.tape.name = 'Bags'
+        self.tape.save()
+        self.assertTrue(ProductVariant.raw_objects.get(pk=self.variant.pk).requires_dimensions)
+
+    def test_variant_requires_dimensions_follows_a_move_to_another_product(self):
+        other = Product.objects.create(category=self.tape, name='Tape', description='Tape')
+        self.variant.product = other
+        self.variant.save()
+        self.assertFalse(ProductVariant.raw_objects.get(pk=self.variant.pk).requires_dimensions)
+
+    def test_cart_lines_follow_the_item_pack_size(self):
+        user = get_user_model().objects.create_user('buyer@example.com', 'Buyer', 'One', password='secret')
+        tier = PricingTier.objects.create(product_variant=self.variant, tier_type='pack', range_start=1, no_end_range=True)
+        PricingTierData.objects.create(item=self.item, pricing_tier=tier, price=Decimal('0.50'))
+        line = CartItem(cart=user.cart, item=self.item, pricing_tier=tier, pack_quantity=2)
+        line.save()
+        self.item.units_per_pack = 12
+        self.item.save()
+        line = CartItem.objects.get(pk=line.pk)
+        self.assertEqual(line.units_per_pack, 12)
+        self.assertEqual(line.total_units, 24)
+
+
+class ExclusivePriceRoundingTests(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name='Boxes')
+        product = Product.objects.create(category=category, name='Box', description='Box')
+        variant = ProductVariant.objects.create(product=product, name='Small', show_units_per='pack')
+        self.tier = PricingTier.objects.create(product_variant=variant, tier_type='pack', range_start=1, no_end_range=True)
+        self.item = create_item(variant, 'BOX-1', units_per_pack=6)
+        PricingTierData.objects.create(item=self.item, pricing_tier=self.tier, price=Decimal('1.37'))
+        self.user = get_user_model().objects.create_user('buyer@example.com', 'Buyer', 'One', password='secret')
+
+    def test_cart_subtotal_matches_the_percentage_formula(self):
+        for discount in (Decimal('12.5'), Decimal('33.33')):
+            with self.subTest(discount=discount):
+                UserExclusivePrice.objects.filter(user=self.user).delete()
+                exclusive_price = UserExclusivePrice.objects.create(
+                    user=self.user, item=self.item, discount_percentage=discount
+                )
+                self.user.cart.items.all().delete()
+                CartItem(
+                    cart=self.user.cart, item=self.item, pricing_tier=self.tier, pack_quantity=7,
+                    user_exclusive_price=exclusive_price,
+                ).save()
+                # The formula used before the multiplier was stored
+                total = Decimal('1.37') * 6 * 7
+                expected = (total * (1 - discount / 100)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+                self.assertEqual(self.user.cart.calculate_subtotal(), expected)
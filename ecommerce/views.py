@@ -16,7 +16,7 @@ from ecommerce.serializers import (
     CartSerializer, CartItemSerializer, OrderSerializer, OrderItemSerializer, CartItemDetailSerializer, OrderItemDetailSerializer, ShippingAddressSerializer, BillingAddressSerializer
 )
 from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank, SearchHeadline
-from django.db.models import Q
+from django.db.models import Q, Prefetch
 from decimal import Decimal
 from rest_framework.exceptions import PermissionDenied
 from django.core.exceptions import ValidationError
@@ -73,7 +73,9 @@ class ProductImageViewSet(viewsets.ModelViewSet):
 
 class ProductViewSet(viewsets.ModelViewSet):
     renderer_classes = [CustomRenderer]
-    queryset = Product.objects.all().select_related('category').prefetch_related('images')
+    queryset = Product.objects.all().select_related('category').prefetch_related(
+        Prefetch('images', queryset=ProductImage.raw_objects.all())
+    )
     serializer_class = ProductSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
@@ -92,11 +94,8 @@ class ProductViewSet(viewsets.ModelViewSet):
         search_query = self.request.query_params.get('search')
 
         if category_slug:
-            try:
-                category = Category.objects.get(slug=category_slug)
-                qs = qs.filter(category=category)
-            except Category.DoesNotExist:
-                qs = qs.none()
+            # Filter through the join instead of loading the category (and its description) first
+            qs = qs.filter(category__slug=category_slug)
 
         if slug:
             qs = qs.filter(slug=slug)
@@ -143,7 +142,7 @@ class ProductViewSet(viewsets.ModelViewSet):
 
 class ProductVariantViewSet(viewsets.ModelViewSet):
     renderer_classes = [CustomRenderer]
-    queryset = ProductVariant.objects.filter(status="active").select_related('product').prefetch_related('pricing_tiers__pricing_data')
+    queryset = ProductVariant.with_catalog_prefetch(ProductVariant.objects.filter(status="active"))
     serializer_class = ProductVariantSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
@@ -198,11 +197,10 @@ class ProductVariantViewSet(viewsets.ModelViewSet):
                     applicable_tier = tier
                     break
             if applicable_tier:
-                try:
-                    pricing_data = PricingTierData.objects.get(item=item, pricing_tier=applicable_tier)
-                    total = packs * pricing_data.price
-                except PricingTierData.DoesNotExist:
+                price = PricingTierData.get_price(item.pk, applicable_tier.pk)
+                if price is None:
                     return Response({"error": f"No pricing data found for tier {applicable_tier}"}, status=status.HTTP_400_BAD_REQUEST)
+                total = packs * price
         elif show_units_per in ['pallet', 'both'] and price_per == 'pallet':
             tiers = pv.pricing_tiers.filter(tier_type='pallet').order_by('range_start')
             applicable_tier = None
@@ -212,11 +210,10 @@ class ProductVariantViewSet(viewsets.ModelViewSet):
                     applicable_tier = tier
                     break
             if applicable_tier:
-                try:
-                    pricing_data = PricingTierData.objects.get(item=item, pricing_tier=applicable_tier)
-                    total = pallets * pricing_data.price
-                except PricingTierData.DoesNotExist:
+                price = PricingTierData.get_price(item.pk, applicable_tier.pk)
+                if price is None:
                     return Response({"error": f"No pricing data found for tier {applicable_tier}"}, status=status.HTTP_400_BAD_REQUEST)
+                total = pallets * price
         else:
             tiers = pv.pricing_tiers.filter(tier_type='pack').order_by('range_start')
             applicable_tier = None
@@ -226,12 +223,11 @@ class ProductVariantViewSet(viewsets.ModelViewSet):
                     applicable_tier = tier
                     break
             if applicable_tier:
-                try:
-                    pricing_data = PricingTierData.objects.get(item=item, pricing_tier=applicable_tier)
-                    price_per_unit = pricing_data.price / units_per_pack
-                    total = units * price_per_unit
-                except PricingTierData.DoesNotExist:
+                price = PricingTierData.get_price(item.pk, applicable_tier.pk)
+                if price is None:
                     return Response({"error": f"No pricing data found for tier {applicable_tier}"}, status=status.HTTP_400_BAD_REQUEST)
+                price_per_unit = price / units_per_pack
+                total = units * price_per_unit
 
         return Response({
             'units': units,
@@ -242,7 +238,9 @@ class ProductVariantViewSet(viewsets.ModelViewSet):
 
 class PricingTierViewSet(viewsets.ModelViewSet):
     renderer_classes = [CustomRenderer]
-    queryset = PricingTier.objects.all().select_related('product_variant').prefetch_related('pricing_data')
+    queryset = PricingTier.objects.all().select_related('product_variant').prefetch_related(
+        Prefetch('pricing_data', queryset=PricingTierData.raw_objects.all())
+    )
     serializer_class = PricingTierSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
@@ -298,11 +296,17 @@ class ItemImageViewSet(viewsets.ModelViewSet):
 
 class ItemViewSet(viewsets.ModelViewSet):
     renderer_classes = [CustomRenderer]
-    queryset = Item.objects.all().select_related('product_variant__product__category').prefetch_related('data_entries__field', 'images', 'pricing_tier_data')
+    queryset = Item.objects.all().select_related('product_variant__product__category').prefetch_related(
+        # Prefetched rows are already linked to their item; skip the joins of the default managers
+        Prefetch('data_entries', queryset=ItemData.raw_objects.select_related('field')),
+        Prefetch('images', queryset=ItemImage.raw_objects.all()),
+        Prefetch('pricing_tier_data', queryset=PricingTierData.raw_objects.all()),
+        *ProductVariant.catalog_prefetches('product_variant__')
+    )
     serializer_class = ItemSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['product_variant', 'sku', 'status']
+    filterset_fields = ['product_variant', 'status']
     pagination_class = StandardResultsSetPagination
 
     def get_permissions(self):
@@ -312,6 +316,11 @@ class ItemViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         qs = super().get_queryset()
+        sku = self.request.query_params.get('sku')
+        if sku:
+            # SKUs are saved upper-cased (Item.clean); rows saved before that keep their original
+            # case, so the raw value is matched too. Both are equality lookups on the unique index
+            qs = qs.filter(Q(sku=sku.strip().upper()) | Q(sku=sku))
         width = self.request.query_params.get('width')
         length = self.request.query_params.get('length')
         height = self.request.query_params.get('height')
@@ -534,7 +543,7 @@ class CartItemViewSet(viewsets.ModelViewSet):
                     ).first() if user_exclusive_price_id else None
                 )
                 cart_item.full_clean()
-                cart_item.save()
+                cart_item.save(skip_validation=True)
                 serializer = CartItemDetailSerializer(cart_item, context=serializer_context)
             elif existing_pallet_item and unit_type == 'pallet':
                 # Add to existing pallet quantity
@@ -546,7 +555,7 @@ class CartItemViewSet(viewsets.ModelViewSet):
                     item=item
                 ).first() if user_exclusive_price_id else None
                 existing_pallet_item.full_clean()
-                existing_pallet_item.save()
+                existing_pallet_item.save(skip_validation=True)
                 serializer = CartItemDetailSerializer(existing_pallet_item, context=serializer_context)
             else:
                 # Default behavior for pack items
@@ -559,7 +568,7 @@ class CartItemViewSet(viewsets.ModelViewSet):
                     item=item
                 ).first() if user_exclusive_price_id else None
                 existing_item.full_clean()
-                existing_item.save()
+                existing_item.save(skip_validation=True)
                 serializer = CartItemDetailSerializer(existing_item, context=serializer_context)
         else:
             # Create new item
@@ -576,7 +585,7 @@ class CartItemViewSet(viewsets.ModelViewSet):
                 ).first() if user_exclusive_price_id else None
             )
             cart_item.full_clean()
-            cart_item.save()
+            cart_item.save(skip_validation=True)
             serializer = CartItemDetailSerializer(cart_item, context=serializer_context)
 
         return serializer.data
@@ -728,7 +737,7 @@ class OrderItemViewSet(viewsets.ModelViewSet):
             else:
                 existing_order_item.user_exclusive_price = None
             existing_order_item.full_clean()
-            existing_order_item.save()
+            existing_order_item.save(skip_validation=True)
             serializer = OrderItemDetailSerializer(existing_order_item, context=serializer_context)
         else:
             order_item_data = {
@@ -745,7 +754,7 @@ class OrderItemViewSet(viewsets.ModelViewSet):
             }
             order_item = OrderItem(**order_item_data)
             order_item.full_clean()
-            order_item.save()
+            order_item.save(skip_validation=True)
             serializer = OrderItemDetailSerializer(order_item, context=serializer_context)
 
         return serializer.data
@@ -775,7 +784,7 @@ class OrderItemViewSet(viewsets.ModelViewSet):
 
         try:
             instance.full_clean()
-            instance.save()
+            instance.save(skip_validation=True)
         except ValidationError as e:
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 